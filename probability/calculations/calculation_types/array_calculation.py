@@ -31,7 +31,7 @@ class ArrayCalculation(ProbabilityCalculation):
         if len(contexts) == 0:
             context = CalculationContext()
         elif len(contexts) == 1:
-            context = list(contexts)[0]
+            context = next(iter(contexts))
         else:
             raise ValueError(
                 'More than one context present in inputs to Minimum calculation'
@@ -1,5 +1,5 @@
 from itertools import chain, product, repeat
-from typing import List, Dict, Optional, Union, TYPE_CHECKING
+from typing import List, Dict, Optional, Union, TYPE_CHECKING, FrozenSet
 
 from numpy import product as np_product
 from pandas import DataFrame, Series, MultiIndex, concat
@@ -8,6 +8,7 @@ if TYPE_CHECKING:
     from probability.discrete import Discrete
 
 from probability.discrete.mixins import StatesMixin
+from probability.discrete.prob_utils import series_from_dict
 
 
 class Conditional(
@@ -48,6 +49,9 @@ class Conditional(
             self._data.columns.names = conditional_variables
         self._joint_variables = list(data.index.names)
         self._conditional_variables = list(data.columns.names)
+        self._conditional_set: FrozenSet[str] = frozenset(
+            self._conditional_variables
+        )
         if states is None:
             states = {
                 **{
@@ -66,6 +70,9 @@ class Conditional(
                                          conditional_variables):
                 raise ValueError('states must match variables')
         self._states: Dict[str, list] = states
+        str_joints = ','.join(self._joint_variables)
+        str_conds = ','.join(self._conditional_variables)
+        self._name = f'p({str_joints}|{str_conds})'
 
     @staticmethod
     def from_probs(
@@ -90,7 +97,7 @@ class Conditional(
                        data.
         """
         if isinstance(data, dict):
-            data = Series(data)
+            data = series_from_dict(data)
         if isinstance(joint_variables, str):
             joint_variables = [joint_variables]
         if isinstance(conditional_variables, str):
@@ -135,16 +142,17 @@ class Conditional(
                                    given, uses states present in the data.
         """
         if isinstance(data, dict):
-            data = Series(data)
+            data = series_from_dict(data)
         joint_variables = [joint_variable]
         if isinstance(conditional_variables, str):
             conditional_variables = [conditional_variables]
         binary_data = {}
-        for ix, value in data.items():
-            if isinstance(data.index, MultiIndex):
-                binary_data[tuple([1] + list(ix))] = value
-                binary_data[tuple([0] + list(ix))] = 1 - value
-            else:
+        if isinstance(data.index, MultiIndex):
+            for ix, value in data.items():
+                binary_data[(1, *ix)] = value
+                binary_data[(0, *ix)] = 1 - value
+        else:
+            for ix, value in data.items():
                 binary_data[(ix, 1)] = value
                 binary_data[(ix, 0)] = 1 - value
         if conditional_states is not None:
@@ -163,8 +171,10 @@ class Conditional(
 
     @property
     def data(self) -> DataFrame:
-
-        return self._data
+        """
+        Return a copy of the conditional probability table.
+        """
+        return self._data.copy()
 
     @property
     def joint_variables(self) -> List[str]:
@@ -204,10 +214,10 @@ class Conditional(
         :param given_conditions: Dict[{name}__{comparator}, value] for each
                                  conditioned variable.
         """
-        condition_names = given_conditions.keys()
-        if not set(condition_names).issubset(self._conditional_variables):
+        if not all(name in self._conditional_set
+                   for name in given_conditions.keys()):
             raise ValueError('given variables is not subset of conditions')
-        elif set(condition_names) == set(self._conditional_variables):
+        elif len(given_conditions) == len(self._conditional_set):
             from probability.discrete import Discrete
             selector = [given_conditions[variable]
                         for variable in self._conditional_variables]
@@ -218,14 +228,15 @@ class Conditional(
             )
         else:
             given_vars = list(given_conditions.keys())
+            given_positions = [
+                (self._conditional_variables.index(variable),
+                 given_conditions[variable])
+                for variable in given_vars
+            ]
             selectors = [
                 col for col in self._data.columns
-                if all(
-                    col[
-                        self._conditional_variables.index(variable)
-                    ] == given_conditions[variable]
-                    for variable in given_vars
-                )
+                if all(col[position] == value
+                       for position, value in given_positions)
             ]
             cond_data = self._data[selectors]
             drop_cols = given_vars if len(given_vars) > 1 else given_vars[0]
@@ -240,9 +251,7 @@ class Conditional(
 
     def __repr__(self):
 
-        str_joints = ','.join(self._joint_variables)
-        str_conds = ','.join(self._conditional_variables)
-        return f'p({str_joints}|{str_conds})'
+        return self._name
 
     def __mul__(self, other: 'Conditional'):
 
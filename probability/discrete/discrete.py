@@ -1,13 +1,16 @@
-from itertools import product
-from typing import Union, List, Dict, overload, Optional, Hashable
+from typing import Union, List, Dict, overload, Optional, Hashable, Tuple, \
+    FrozenSet, Any
 
-from pandas import Series, DataFrame, MultiIndex, merge
+from numpy import arange, argsort, concatenate, full, int32, minimum, nan, \
+    ndarray, outer, searchsorted, sort, tile, where, unique as np_unique
+from pandas import Series, DataFrame, Index, MultiIndex, factorize
 from pandas.core.dtypes.inference import is_number
 
 from probability.discrete.conditional import Conditional
 from probability.discrete.mixins import StatesMixin
 from probability.discrete.prob_utils import p, given, valid_name_comparator, \
-    p_or
+    p_or, group_normalize, group_sum, keys_fit_int64, pack_codes, \
+    series_from_dict
 
 
 class Discrete(
@@ -31,21 +34,97 @@ class Discrete(
                  variables: Union[str, List[str]],
                  states: Union[list, Dict[str, list]]):
 
-        self._data = data
+        # keep a private copy of the probabilities so that the lookups and
+        # derived distributions cached below can't go stale
+        self._data = data.copy()
         if isinstance(variables, str):
             variables = [variables]
         self._variables: List[str] = variables
+        self._variable_set: FrozenSet[str] = frozenset(variables)
         if isinstance(states, list):
             states = {self._variables[0]: states}
         self._states: Dict[str, list] = states
-        self._data.name = f'p({",".join(self._variables)})'
-        if (
+        self._index_names: Tuple[str, ...] = tuple(self._data.index.names)
+        self._name = f'p({",".join(self._variables)})'
+        self._data.name = self._name
+        self._1d_numeric: Optional[bool] = None
+        self._codes: Optional[Dict[str, ndarray]] = None
+        self._categories: Optional[Dict[str, Index]] = None
+        self._lookup: Optional[Dict[Hashable, float]] = None
+        self._keys: Optional[Tuple[ndarray, ndarray, Tuple[int, ...]]] = None
+        self._derived: Dict[tuple, Union[Conditional, 'Discrete']] = {}
+
+    @property
+    def _is_1d_numeric(self) -> bool:
+        """
+        Return whether the distribution has a single variable with numeric
+        values. Checked on first use.
+        """
+        if self._1d_numeric is None:
+            self._1d_numeric = (
                 not isinstance(self._data.index, MultiIndex) and
                 all(is_number(x) for x in self._data.index)
-        ):
-            self._is_1d_numeric = True
-        else:
-            self._is_1d_numeric = False
+            )
+        return self._1d_numeric
+
+    def _encode(self) -> Tuple[Dict[str, ndarray], Dict[str, Index]]:
+        """
+        Return the 32-bit integer codes of each variable's value in each row
+        of the data, and the sorted categories that the codes index into.
+        Factorizes the index on first use.
+        """
+        if self._codes is None:
+            codes = {}
+            categories = {}
+            for level, variable in enumerate(self._index_names):
+                variable_codes, categories[variable] = factorize(
+                    self._data.index.get_level_values(level), sort=True
+                )
+                codes[variable] = variable_codes.astype(int32)
+            self._codes = codes
+            self._categories = categories
+        return self._codes, self._categories
+
+    def _set_codes(
+            self, codes: Dict[str, ndarray], categories: Dict[str, Index]
+    ):
+        """
+        Set the integer codes and sorted categories of each variable when they
+        are already known, e.g. from the distribution this one was derived
+        from, so that they don't need to be factorized again.
+        """
+        self._codes = {
+            variable: variable_codes.astype(int32, copy=False)
+            for variable, variable_codes in codes.items()
+        }
+        self._categories = categories
+
+    def _state_keys(self) -> Tuple[ndarray, ndarray, Tuple[int, ...]]:
+        """
+        Return the sorted composite integer key of each state, the
+        probabilities in the same order, and the shape used to pack the
+        variable codes into each key. Built on first use.
+        """
+        if self._keys is None:
+            codes, categories = self._encode()
+            shape = tuple(len(categories[variable])
+                          for variable in self._variables)
+            keys, _ = pack_codes(
+                [codes[variable] for variable in self._variables], shape
+            )
+            order = argsort(keys)
+            self._keys = keys[order], self._data.to_numpy()[order], shape
+        return self._keys
+
+    def _lookup_table(self) -> Dict[Hashable, float]:
+        """
+        Return a dict mapping each state of the distribution to its
+        probability. Built on first use, which is safe because the data is a
+        private copy that is never changed.
+        """
+        if self._lookup is None:
+            self._lookup = dict(zip(self._data.index, self._data.to_numpy()))
+        return self._lookup
 
     @property
     def variables(self) -> List[str]:
@@ -72,7 +151,7 @@ class Discrete(
                        there are possible states not represented in the data.
         """
         if isinstance(data, dict):
-            data = Series(data)
+            data = series_from_dict(data)
         if not isinstance(data, Series):
             raise TypeError('data must be dict or Series')
 
@@ -176,8 +255,27 @@ class Discrete(
                 )
 
         # create distribution
-        prob_data: Series = (data.groupby(variables).size() / len(data))
-        return Discrete(data=prob_data, variables=variables, states=states)
+        codes = []
+        categories = []
+        for variable in variables:
+            variable_codes, variable_categories = factorize(
+                data[variable], sort=True
+            )
+            codes.append(variable_codes)
+            categories.append(variable_categories)
+        counts, count_codes = group_sum(
+            codes=codes, categories=categories, names=variables,
+            return_codes=True
+        )
+        prob_data: Series = counts / len(data)
+        distribution = Discrete(
+            data=prob_data, variables=variables, states=states
+        )
+        distribution._set_codes(
+            codes=dict(zip(variables, count_codes)),
+            categories=dict(zip(variables, categories))
+        )
+        return distribution
 
     @staticmethod
     def from_probs(
@@ -217,8 +315,10 @@ class Discrete(
 
     @property
     def data(self) -> Series:
-
-        return self._data
+        """
+        Return a copy of the distribution's probabilities.
+        """
+        return self._data.copy()
 
     def p(self, **kwargs):
         """
@@ -228,8 +328,78 @@ class Discrete(
                        e.g. `C=1`, `D__le=1`.
                        Valid filters are __{eq, ne, lt, gt, le, ge, in, not_in}
         """
+        if (
+                len(kwargs) == len(self._index_names) and
+                self._data.index.is_unique
+        ):
+            # exact state of every variable - look up directly
+            try:
+                key = tuple(kwargs[name] for name in self._index_names)
+            except KeyError:
+                pass  # comparator filter(s) given
+            else:
+                if len(key) == 1:
+                    key = key[0]
+                return self._lookup_table().get(key, 0.0)
         return p(self._data, **kwargs)
 
+    def p_batch(self, data: DataFrame) -> ndarray:
+        """
+        Return the probability of the state given in each row of the data.
+
+        :param data: DataFrame with a column for each variable of the
+                     distribution and one row per state to look up.
+        :return: Array of probabilities, with 0 for states not in the
+                 distribution.
+        """
+        if not all(variable in data.columns for variable in self._variables):
+            raise ValueError('data must have a column for every variable.')
+        return self._p_states(
+            {variable: data[variable] for variable in self._variables},
+            default=0.0
+        )
+
+    def _p_states(self, states: Dict[str, Any], default: float) -> ndarray:
+        """
+        Return the probability of each of a sequence of states.
+
+        :param states: Dict mapping each variable to an array-like of its value
+                       in each state.
+        :param default: Value to return for states not in the distribution.
+        """
+        codes, categories = self._encode()
+        query_codes = [categories[variable].get_indexer(states[variable])
+                       for variable in self._variables]
+        if len(self._data) == 0:
+            return full(len(query_codes[0]), default)
+        found = query_codes[0] >= 0
+        for variable_codes in query_codes[1:]:
+            found &= variable_codes >= 0
+        query_codes = [where(found, variable_codes, 0)
+                       for variable_codes in query_codes]
+        shape = tuple(len(categories[variable])
+                      for variable in self._variables)
+        if keys_fit_int64(shape):
+            # composite keys of the queried states
+            keys, probs, _ = self._state_keys()
+            query_keys, _ = pack_codes(query_codes, shape)
+        else:
+            # keys are re-numbered for the rows packed together, so pack the
+            # states and queried states at the same time
+            num_states = len(self._data)
+            all_keys, _ = pack_codes(
+                [concatenate([codes[variable], variable_codes])
+                 for variable, variable_codes in zip(self._variables,
+                                                     query_codes)],
+                shape
+            )
+            keys, query_keys = all_keys[:num_states], all_keys[num_states:]
+            order = argsort(keys)
+            keys, probs = keys[order], self._data.to_numpy()[order]
+        locations = minimum(searchsorted(keys, query_keys), len(keys) - 1)
+        found &= keys[locations] == query_keys
+        return where(found, probs[locations], default)
+
     def p_or(self, **kwargs) -> float:
         """
         Return the probability that ANY of the conditions hold.
@@ -248,20 +418,46 @@ class Discrete(
                                  conditioned variable.
         """
         # check input variables
-        names_comps = set(given_conditions.keys())
-        if not all([valid_name_comparator(name_comp, self._variables)
-                    for name_comp in names_comps]):
+        if not all(valid_name_comparator(name_comp, self._variable_set)
+                   for name_comp in given_conditions.keys()):
             raise ValueError(
                 'Given variables must be members of joint distribution.'
             )
-        # calculate conditional distribution
-        data = given(self._data, **given_conditions)
         variables = [var for var in self._variables
                      if var not in given_conditions.keys()]
         states = {
             variable: self._states[variable]
             for variable in variables
         }
+        if (
+                len(given_conditions) == 1 and
+                len(self._index_names) > 1 and
+                next(iter(given_conditions)) in self._variable_set
+        ):
+            # single variable equal to a single value - select its rows by
+            # code
+            (given_var, given_val), = given_conditions.items()
+            codes, categories = self._encode()
+            given_code = categories[given_var].get_indexer([given_val])[0]
+            mask = codes[given_var] == given_code
+            probs = self._data.to_numpy()[mask]
+            data = Series(
+                data=probs / probs.sum(),
+                index=self._data.index[mask].droplevel(given_var),
+                name=self._data.name
+            )
+            distribution = Discrete(
+                data=data, variables=variables, states=states
+            )
+            distribution._set_codes(
+                codes={variable: codes[variable][mask]
+                       for variable in variables},
+                categories={variable: categories[variable]
+                            for variable in variables}
+            )
+            return distribution
+        # calculate conditional distribution
+        data = given(self._data, **given_conditions)
         return Discrete(
             data=data, variables=variables, states=states
         )
@@ -277,18 +473,31 @@ class Discrete(
         :param variables: Variable(s) to find unique values / combinations of.
         :param sort_values: Sort before returning.
         """
-        data: DataFrame = self.data.reset_index()
         if len(variables) == 1:
-            unique = data[variables[0]].unique()
+            unique = self._data.index.get_level_values(
+                variables[0]
+            ).unique().to_numpy()
             if sort_values:
                 unique = sorted(unique)
             return unique
         else:
+            # find the first row of each unique combination of codes
+            codes, categories = self._encode()
             variables = list(variables)
-            unique = data[variables].drop_duplicates()
-            if sort_values:
-                unique = unique.sort_values(variables)
-            return unique
+            keys, _ = pack_codes(
+                [codes[variable] for variable in variables],
+                tuple(len(categories[variable]) for variable in variables)
+            )
+            _, rows = np_unique(keys, return_index=True)
+            if not sort_values:
+                rows = sort(rows)
+            return DataFrame(
+                data={
+                    variable: categories[variable].take(codes[variable][rows])
+                    for variable in variables
+                },
+                index=rows
+            )
 
     def conditional(self, *conditionals) -> Conditional:
         """
@@ -297,29 +506,35 @@ class Discrete(
 
         :param conditionals: Names of variables to condition over each value of.
         """
-        col_names = self._data.index.names
+        key = ('conditional', conditionals)
+        if key in self._derived:
+            return self._derived[key]
+        col_names = self._index_names
         joint_variables = [n for n in col_names if n not in conditionals]
         variables = [n for n in col_names if n not in conditionals]
         variables.extend([n for n in col_names if n in conditionals])
-        data = self._data.copy().rename('p_cond').reset_index()
         conditionals = list(conditionals)
+        values = self._data.to_numpy()
         if conditionals:
-            # find total probabilities for each combination of unique values in
-            # the conditional variables e.g. P(C)
-            sums = data.groupby(conditionals).sum().reset_index()
             # normalize each individual probability e.g. p(Ai,Bj,Ck,Dl) to
-            # probability of its conditional values p(Ck)
-            sums = sums[conditionals + ['p_cond']].rename(
-                columns={'p_cond': 'p_sum'})
-            merged = merge(left=data, right=sums, on=conditionals)
-            merged['p_cond'] = merged['p_cond'] / merged['p_sum']
-            data = merged[variables + ['p_cond']]
-        data = data.set_index(variables)['p_cond']
-        return Conditional.from_probs(
+            # the total probability of its conditional values e.g. p(Ck)
+            codes, categories = self._encode()
+            values = group_normalize(
+                codes=[codes[conditional] for conditional in conditionals],
+                categories=[categories[conditional]
+                            for conditional in conditionals],
+                values=values
+            )
+        data = Series(data=values, index=self._data.index, name='p_cond')
+        if isinstance(data.index, MultiIndex):
+            data = data.reorder_levels(variables)
+        distribution = Conditional.from_probs(
             data=data,
             joint_variables=joint_variables,
             conditional_variables=conditionals
         )
+        self._derived[key] = distribution
+        return distribution
 
     def marginal(self, *marginals) -> 'Discrete':
         """
@@ -329,12 +544,18 @@ class Discrete(
         :param marginals: Names of variables to put in the margin.
         :return: Marginalized distribution.
         """
-        if not set(marginals).issubset(self._variables):
+        key = ('marginal', marginals)
+        if key in self._derived:
+            return self._derived[key]
+        if not all(marginal in self._variable_set for marginal in marginals):
             raise ValueError('Marginals are not subset of variables.')
-        data = (
-            self._data.to_frame()
-                .groupby(list(marginals))[self._data.name]
-                .sum()
+        codes, categories = self._encode()
+        data, marginal_codes = group_sum(
+            codes=[codes[marginal] for marginal in marginals],
+            categories=[categories[marginal] for marginal in marginals],
+            names=list(marginals),
+            weights=self._data.to_numpy(),
+            return_codes=True
         )
         variables = [v for v in self._variables
                      if v in marginals]
@@ -342,9 +563,16 @@ class Discrete(
             variable: self._states[variable]
             for variable in variables
         }
-        return Discrete(
+        distribution = Discrete(
             data=data, variables=variables, states=states
         )
+        distribution._set_codes(
+            codes=dict(zip(marginals, marginal_codes)),
+            categories={marginal: categories[marginal]
+                        for marginal in marginals}
+        )
+        self._derived[key] = distribution
+        return distribution
 
     def mean(self):
         """
@@ -356,9 +584,9 @@ class Discrete(
         if self._is_1d_numeric:
             return (
                     Series(
-                        index=self.data.index,
-                        data=self.data.index
-                    ) * self.data
+                        index=self._data.index,
+                        data=self._data.index
+                    ) * self._data
             ).sum()
         else:
             raise TypeError(
@@ -376,8 +604,8 @@ class Discrete(
             mu = self.mean()
             return (
                 Series(
-                    index=self.data.index,
-                    data=self.data.index.to_series() - mu
+                    index=self._data.index,
+                    data=self._data.index.to_series() - mu
                 )
             ).sum()
         else:
@@ -395,7 +623,7 @@ class Discrete(
         For an ND distribution, returns a DataFrame with one column per variable
         and one row per mode.
         """
-        data = self.data.loc[self.data == self.data.max()]
+        data = self._data.loc[self._data == self._data.max()]
         if len(self.variables) == 1:
             mode = data.reset_index()[self.variables[0]]
             if len(mode) > 1:
@@ -412,7 +640,7 @@ class Discrete(
         value of the distribution.
         """
         if self._is_1d_numeric:
-            data = self.data.loc[self.data > 0]
+            data = self._data.loc[self._data > 0]
             return data.index.min()
         else:
             raise TypeError(
@@ -425,7 +653,7 @@ class Discrete(
         value of the distribution.
         """
         if self._is_1d_numeric:
-            data = self.data.loc[self.data > 0]
+            data = self._data.loc[self._data > 0]
             return data.index.max()
         else:
             raise TypeError(
@@ -439,10 +667,22 @@ class Discrete(
         Multiply by another Discrete or by a Conditional.
         """
         if isinstance(other, Conditional):
-            if not set(self._variables).issubset(other.conditional_variables):
+            if not self._variable_set <= other._conditional_set:
                 raise ValueError('variables do not match.')
-            if set(other.conditional_variables) == set(self._variables):
-                data = (other.data * self._data).stack(self._variables)
+            if self._variable_set == other._conditional_set:
+                # scale each column of the table by the probability of its
+                # conditional values
+                columns = other._data.columns
+                marginal = self._data
+                if isinstance(marginal.index, MultiIndex):
+                    marginal = marginal.reorder_levels(columns.names)
+                joint = DataFrame(
+                    data=(other._data.to_numpy() *
+                          marginal.reindex(columns).to_numpy()),
+                    index=other._data.index,
+                    columns=columns
+                )
+                data = joint.stack(self._variables)
                 return Discrete(
                     data=data,
                     variables=list(data.index.names),
@@ -450,15 +690,19 @@ class Discrete(
                 )
             else:
                 # stack by conditional variables of Conditional
-                stacked = other.data.stack(other.conditional_variables)
-                # stack by joint variables of Discrete
-                unstacked = stacked.unstack(self._variables)
+                stacked = other._data.stack(other.conditional_variables)
+                # look up the probability of the Discrete's states in each row
+                probs = self._p_states(
+                    states={
+                        variable: stacked.index.get_level_values(variable)
+                        for variable in self._variables
+                    },
+                    default=nan
+                )
                 # calculate new distribution
-                distribution = self._data * unstacked
+                distribution = (stacked * probs).dropna()
                 # reshape for new conditional
-                reshaped: DataFrame = distribution.stack(
-                    self._variables
-                ).unstack(
+                reshaped: DataFrame = distribution.unstack(
                     list(set(other.conditional_variables) -
                          set(self._variables))
                 )
@@ -476,26 +720,29 @@ class Discrete(
                     states=other._states
                 )
         elif isinstance(other, Discrete):
-            results = {}
-            for (d1_state, d1_value), (d2_state, d2_value) in product(
-                self._data.items(), other._data.items()
-            ):
-                if isinstance(d1_state, tuple):
-                    k1 = [x for x in d1_state]
-                else:
-                    k1 = [d1_state]
-                if isinstance(d2_state, tuple):
-                    k2 = [x for x in d2_state]
-                else:
-                    k2 = [d2_state]
-                key = tuple(k1 + k2)
-                results[key] = d1_value * d2_value
-            data = Series(results)
+            # pair every state of self with every state of other
+            num_self = len(self._data)
+            num_other = len(other._data)
+            self_rows = arange(num_self).repeat(num_other)
+            other_rows = tile(arange(num_other), num_self)
             variables = (
-                list(self._data.index.names) +
-                list(other._data.index.names)
+                list(self._index_names) + list(other._index_names)
+            )
+            index = MultiIndex.from_arrays(
+                [
+                    self._data.index.get_level_values(level).take(self_rows)
+                    for level in range(self._data.index.nlevels)
+                ] + [
+                    other._data.index.get_level_values(level).take(other_rows)
+                    for level in range(other._data.index.nlevels)
+                ],
+                names=variables
+            )
+            data = Series(
+                data=outer(self._data.to_numpy(),
+                           other._data.to_numpy()).ravel(),
+                index=index
             )
-            data.index.names = variables
             return Discrete(
                 data=data,
                 variables=variables,
@@ -508,7 +755,26 @@ class Discrete(
 
     def __truediv__(self, other: 'Discrete') -> 'Discrete':
 
-        data = self.data / other.data
+        if (
+                isinstance(other, Discrete) and
+                len(other._index_names) == 1 and
+                other._variable_set < self._variable_set and
+                other._data.index.is_unique
+        ):
+            # divide each state by the probability of its value of the
+            # other distribution's variable e.g. p(A,B) / p(B)
+            denominators = other._p_states(
+                {variable: self._data.index.get_level_values(variable)
+                 for variable in other._variables},
+                default=nan
+            )
+            data = Series(
+                data=self._data.to_numpy() / denominators,
+                index=self._data.index,
+                name=self._data.name
+            )
+        else:
+            data = self._data / other.data
         return Discrete(
             data=data,
             variables=data.index.names,
@@ -517,5 +783,5 @@ class Discrete(
 
     def __repr__(self):
 
-        return f'p({",".join(self._variables)})'
+        return self._name
 
@@ -0,0 +1,5 @@
+class StatesMixin(object):
+
+    @property
+    def states(self):
+        return self._states
@@ -1,65 +1,275 @@
-from typing import Any, Tuple, List, Hashable
+from functools import lru_cache
+from operator import eq, ne, lt, gt, le, ge
+from typing import Any, Tuple, List, Hashable, Optional, Union, Dict, \
+    Callable, Iterable
 
-from pandas import Series, DataFrame
+from numba import jit
+from numpy import arange, bincount, empty, flatnonzero, float64, fromiter, \
+    iinfo, int64, ndarray, ones, ravel_multi_index, unique, zeros
+from pandas import Series, Index, MultiIndex, factorize
 
 
-def _filter_distribution(
-        distribution: DataFrame,
-        distribution_name: Hashable,
-        name_comparator: str, value: Any
-) -> Tuple[DataFrame, str]:
+@lru_cache(maxsize=256)
+def _name_comparator_table(
+        var_names: Tuple[Hashable, ...]
+) -> Dict[str, Tuple[Hashable, str]]:
     """
-    Filter probability distribution data using the variable name, comparator
-    code and value.
+    Return a table mapping every valid filter name for the variables to its
+    variable name and comparator code.
+
+    :param var_names: Names of the variables that can be filtered on.
+    """
+    table = {}
+    for code in _match_codes:
+        for var_name in var_names:
+            table.setdefault(f'{var_name}__{code}', (var_name, code))
+    # plain variable names filter on equality
+    for var_name in var_names:
+        table[var_name] = (var_name, 'eq')
+    return table
+
+
+def _parse_name_comparator(
+        name_comparator: str, var_names: List[Hashable]
+) -> Tuple[Hashable, str]:
+    """
+    Split a filter name into its variable name and comparator code.
 
-    :param distribution: The probability distribution data to filter.
     :param name_comparator: Amalgamation of variable name and filtering
-                            comparator in the form '{name}__{comparator}'.
-    :param value: Value to filter to.
-    :return: Filtered Data, Variable Name
-    """
-    var_names = [col for col in distribution if col != distribution_name]
-
-    def match_var(code: str) -> bool:
-        return name_comparator in [f'{var_name}__{code}'
-                                   for var_name in var_names]
-
-    if name_comparator in var_names:
-        return distribution.loc[
-            distribution[name_comparator] == value
-        ], name_comparator
-    elif match_var('eq'):
-        return distribution.loc[
-            distribution[name_comparator[: -4]] == value
-        ], name_comparator[: -4]
-    elif match_var('ne'):
-        return distribution.loc[
-            distribution[name_comparator[: -4]] != value
-        ], name_comparator[: -4]
-    elif match_var('lt'):
-        return distribution.loc[
-            distribution[name_comparator[: -4]] < value
-        ], name_comparator[: -4]
-    elif match_var('gt'):
-        return distribution.loc[
-            distribution[name_comparator[: -4]] > value
-        ], name_comparator[: -4]
-    elif match_var('le'):
-        return distribution.loc[
-            distribution[name_comparator[: -4]] <= value
-        ], name_comparator[: -4]
-    elif match_var('ge'):
-        return distribution.loc[
-            distribution[name_comparator[: -4]] >= value
-        ], name_comparator[: -4]
-    elif match_var('in'):
-        return distribution.loc[
-            distribution[name_comparator[: -4]].isin(value)
-        ], name_comparator[: -4]
-    elif match_var('not_in'):
-        return distribution.loc[
-            ~distribution[name_comparator[: -8]].isin(value)
-        ], name_comparator[: -8]
+                            comparator in the form '{name}__{comparator}', or
+                            just the variable name for equality.
+    :param var_names: Names of the variables that can be filtered on.
+    :return: Variable Name, Comparator Code
+    """
+    try:
+        return _name_comparator_table(tuple(var_names))[name_comparator]
+    except KeyError:
+        raise ValueError(f'Invalid variable filter: {name_comparator}')
+
+
+_comparators: Dict[str, Callable[[Any, Any], Any]] = {
+    'eq': eq,
+    'ne': ne,
+    'lt': lt,
+    'gt': gt,
+    'le': le,
+    'ge': ge,
+    'in': lambda values, value: values.isin(value),
+    'not_in': lambda values, value: ~values.isin(value),
+}
+
+
+def _compare(values, code: str, value: Any):
+    """
+    Compare each of the values to a filter value.
+
+    :param values: Series or Index of variable values to compare.
+    :param code: Comparator code.
+    :param value: Value to compare to.
+    :return: Boolean mask of matching values.
+    """
+    return _comparators[code](values, value)
+
+
+def _filter_mask(
+        distribution: Series, joint_vars_vals: Dict[str, Any],
+        match_all: bool = True
+) -> ndarray:
+    """
+    Return a mask of the states of the distribution that match ALL (or ANY)
+    of the filters.
+
+    :param distribution: Distribution data to filter.
+    :param joint_vars_vals: Names and values of variables to filter on
+                            e.g. `C=1`, `D__le=1`.
+    :param match_all: Whether states must match all of the filters rather than
+                      any of them.
+    """
+    index = distribution.index
+    var_names = list(index.names)
+    if match_all:
+        mask = ones(len(distribution), dtype=bool)
+    else:
+        mask = zeros(len(distribution), dtype=bool)
+    for joint_var, joint_val in joint_vars_vals.items():
+        var_name, code = _parse_name_comparator(joint_var, var_names)
+        matches = _compare(index.get_level_values(var_name), code, joint_val)
+        if match_all:
+            mask &= matches
+        else:
+            mask |= matches
+    return mask
+
+
+def series_from_dict(data: dict) -> Series:
+    """
+    Create a Series of probabilities or counts from a dict mapping states to
+    values. Tuple keys are split into the levels of a MultiIndex.
+
+    :param data: Dict mapping a state or tuple of states to a value.
+    """
+    keys = list(data.keys())
+    values = fromiter(data.values(), dtype=float64, count=len(keys))
+    if (
+            len(keys) > 0 and isinstance(keys[0], tuple) and
+            all(isinstance(key, tuple) and len(key) == len(keys[0])
+                for key in keys)
+    ):
+        index = MultiIndex.from_arrays(list(zip(*keys)))
+    else:
+        index = Index(keys)
+    return Series(data=values, index=index)
+
+
+_MAX_KEY: int = iinfo(int64).max
+
+
+def keys_fit_int64(shape: Tuple[int, ...]) -> bool:
+    """
+    Return whether every combination of codes for the shape can be packed
+    into an int64 key without re-numbering, i.e. whether pack_codes gives the
+    same key to the same codes whichever rows are packed with them.
+
+    :param shape: Number of categories of each variable.
+    """
+    num_keys = 1
+    for size in shape:
+        num_keys *= size
+    return num_keys <= _MAX_KEY
+
+
+def pack_codes(
+        codes: List[ndarray], shape: Tuple[int, ...]
+) -> Tuple[ndarray, int]:
+    """
+    Pack the integer codes of each row into a single integer key, so that keys
+    sort in the same order as the rows' combinations of codes.
+
+    :param codes: Array of integer codes for each variable, with one element
+                  per row.
+    :param shape: Number of categories of each variable.
+    :return: Keys, Number of possible keys
+    """
+    if keys_fit_int64(shape):
+        num_keys = 1
+        for size in shape:
+            num_keys *= size
+        return ravel_multi_index(codes, shape), num_keys
+    # key space overflows int64 - renumber the observed partial keys before
+    # they would overflow
+    keys = codes[0].astype(int64)
+    num_keys = shape[0]
+    for variable_codes, size in zip(codes[1:], shape[1:]):
+        if num_keys > _MAX_KEY // size:
+            keys, partial_keys = factorize(keys, sort=True)
+            num_keys = len(partial_keys)
+        keys = keys * size + variable_codes
+        num_keys *= size
+    return keys, num_keys
+
+
+def group_sum(
+        codes: List[ndarray], categories: List[Index], names: List[str],
+        weights: Optional[ndarray] = None, return_codes: bool = False
+) -> Union[Series, Tuple[Series, Tuple[ndarray, ...]]]:
+    """
+    Sum the weights, or count the rows if no weights are given, for each
+    unique combination of integer codes.
+
+    :param codes: Array of integer codes for each variable, with one element
+                  per row. Rows with a negative code for any variable are
+                  ignored.
+    :param categories: Sorted categories that each variable's codes index into.
+    :param names: Name of each variable.
+    :param weights: Optional weight of each row.
+    :param return_codes: Whether to also return the codes of each variable
+                         in each row of the result.
+    :return: Series of sums, indexed by the observed combinations of
+             categories in sorted order.
+    """
+    shape = tuple(len(variable_categories) for variable_categories in
+                  categories)
+    valid = (codes[0] >= 0)
+    for variable_codes in codes[1:]:
+        valid &= (variable_codes >= 0)
+    if not valid.all():
+        codes = [variable_codes[valid] for variable_codes in codes]
+        if weights is not None:
+            weights = weights[valid]
+    keys, num_keys = pack_codes(codes, shape)
+    if num_keys <= 2 * len(keys):
+        # few possible combinations - count into every key and keep the
+        # observed ones, which avoids sorting the keys
+        unique_keys = flatnonzero(bincount(keys, minlength=num_keys))
+        sums = bincount(keys, weights=weights, minlength=num_keys)[unique_keys]
+        # any row with a key has the same codes as the others with that key
+        key_rows = empty(num_keys, dtype=int64)
+        key_rows[keys] = arange(len(keys))
+        key_rows = key_rows[unique_keys]
+    else:
+        _, key_rows, inverse = unique(
+            keys, return_index=True, return_inverse=True
+        )
+        sums = bincount(inverse, weights=weights)
+    unique_codes = tuple(variable_codes[key_rows]
+                         for variable_codes in codes)
+    if len(names) == 1:
+        index = Index(categories[0].take(unique_codes[0]), name=names[0])
+    else:
+        index = MultiIndex.from_arrays(
+            [variable_categories.take(variable_codes)
+             for variable_categories, variable_codes in zip(categories,
+                                                            unique_codes)],
+            names=names
+        )
+    sums = Series(data=sums, index=index)
+    if return_codes:
+        return sums, unique_codes
+    return sums
+
+
+@jit(nopython=True, error_model='numpy')
+def _normalize_groups(
+        groups: ndarray, values: ndarray, num_groups: int
+) -> ndarray:
+    """
+    Divide each value by the sum of the values in its group. Values in a
+    group that sums to zero become NaN.
+
+    :param groups: Group number of each value, from 0 to num_groups - 1.
+    :param values: Values to normalize.
+    :param num_groups: Number of groups.
+    """
+    sums = zeros(num_groups)
+    for i in range(len(values)):
+        sums[groups[i]] += values[i]
+    normalized = empty(len(values))
+    for i in range(len(values)):
+        normalized[i] = values[i] / sums[groups[i]]
+    return normalized
+
+
+def group_normalize(
+        codes: List[ndarray], categories: List[Index], values: ndarray
+) -> ndarray:
+    """
+    Divide each value by the sum of the values sharing its combination of
+    integer codes.
+
+    :param codes: Array of integer codes for each variable, with one element
+                  per value.
+    :param categories: Categories that each variable's codes index into.
+    :param values: Values to normalize e.g. joint probabilities.
+    :return: Array of normalized values in the original order.
+    """
+    shape = tuple(len(variable_categories) for variable_categories in
+                  categories)
+    keys, num_keys = pack_codes(codes, shape)
+    if num_keys <= 2 * len(keys):
+        # few possible combinations - use the keys as group numbers directly
+        return _normalize_groups(keys, values.astype(float), num_keys)
+    unique_keys, groups = unique(keys, return_inverse=True)
+    return _normalize_groups(groups, values.astype(float), len(unique_keys))
 
 
 def p(distribution: Series, **joint_vars_vals) -> float:
@@ -70,15 +280,10 @@ def p(distribution: Series, **joint_vars_vals) -> float:
     :param joint_vars_vals: Names and values of variables to find probability of
                             e.g. `C=1`, `D__le=1`.
     """
-    dist_name = distribution.name
-    data = distribution.copy().reset_index()
-    for joint_var, joint_val in joint_vars_vals.items():
-        # filter individual probabilities to specified values e.g. P(A,B,C,D=d1)
-        data, _ = _filter_distribution(
-            data, dist_name, joint_var, joint_val
-        )
+    # filter individual probabilities to specified values e.g. P(A,B,C,D=d1)
+    mask = _filter_mask(distribution, joint_vars_vals)
     # calculate probability
-    return data[dist_name].sum()
+    return distribution.to_numpy()[mask].sum()
 
 
 def p_or(distribution: Series, **joint_vars_vals) -> float:
@@ -89,17 +294,11 @@ def p_or(distribution: Series, **joint_vars_vals) -> float:
     :param joint_vars_vals: Names and values of variables to find probability of
                             e.g. `C=1`, `D__le=1`.
     """
-    dist_name = distribution.name
-    data = distribution.copy().reset_index()
-    or_ix = set()
-    for joint_var, joint_val in joint_vars_vals.items():
-        # filter individual probabilities to specified values e.g. P(A,B,C,D=d1)
-        filtered, _ = _filter_distribution(
-            data, dist_name, joint_var, joint_val
-        )
-        or_ix.update(filtered.index)
+    # find individual probabilities matching any of the specified values
+    # e.g. P(A=a1 or D=d1)
+    mask = _filter_mask(distribution, joint_vars_vals, match_all=False)
     # calculate probability
-    return data.loc[or_ix, dist_name].sum()
+    return distribution.to_numpy()[mask].sum()
 
 
 def given(distribution: Series, **givens) -> Series:
@@ -115,50 +314,57 @@ def given(distribution: Series, **givens) -> Series:
              cond_values.
              Contains a single probability distribution summing to 1.
     """
-    dist_name = distribution.name
-    col_names = distribution.index.names
-    joint_names = ([
-        n for n in col_names
-        if n not in givens.keys()  # not a given variable name w/o comparator
-        and not set(
-            [f'{n}__{code}' for code in _match_codes]
-        ).intersection(givens.keys())  # not a given variable name w/ comparator
-    ])
-    var_names = joint_names.copy()
-    data = distribution.copy().reset_index()
+    index = distribution.index
+    index_names = list(index.names)
+    # filter individual probabilities to given values e.g. P(A,B,C,D=d1)
+    mask = ones(len(distribution), dtype=bool)
+    compared_names = []
     for given_var, given_val in givens.items():
-        # filter individual probabilities to given values e.g. P(A,B,C,D=d1)
-        data, var_name = _filter_distribution(
-            data, dist_name, given_var, given_val
+        var_name, code = _parse_name_comparator(given_var, index_names)
+        mask &= _compare(index.get_level_values(var_name), code, given_val)
+        if var_name != given_var and var_name not in compared_names:
+            compared_names.append(var_name)
+    # keep variables that were not given a value, followed by variables
+    # filtered with a comparator
+    var_names = [
+        var_name for var_name in index_names
+        if var_name not in givens.keys() and var_name not in compared_names
+    ] + [
+        var_name for var_name in compared_names
+        if var_name not in givens.keys()
+    ]
+    if len(var_names) == 0:
+        raise ValueError('Cannot condition on a value of every variable.')
+    index = index[mask]
+    if len(var_names) == 1:
+        index = index.get_level_values(var_names[0])
+    else:
+        index = MultiIndex.from_arrays(
+            [index.get_level_values(var_name) for var_name in var_names],
+            names=var_names
         )
-        var_names.append(var_name)
     # normalize each individual remaining probability P(Ai,Bj,Ck,d1)
     # to the sum of remaining probabilities P(A,B,C,d1)
-    data[dist_name] = data[dist_name] / data[dist_name].sum()
-    return data.set_index([
-        var_name for var_name in var_names
-        if var_name not in givens.keys()
-    ])[dist_name]
+    probs = distribution.to_numpy()[mask]
+    return Series(
+        data=probs / probs.sum(), index=index, name=distribution.name
+    )
 
 
 _match_codes: List[str] = ['eq', 'ne', 'lt', 'gt', 'le', 'ge', 'in', 'not_in']
 
 
-def valid_name_comparator(name_comparator: str, var_names: List[str]) -> bool:
+def valid_name_comparator(
+        name_comparator: str, var_names: Iterable[str]
+) -> bool:
     """
     Return whether the given name is a valid conditioning filter name for any of
     the variables in var_names.
 
     :param name_comparator: Amalgamation of variable name and filtering
                             comparator in the form '{name}__{comparator}'.
-    :param var_names: List of valid variables names to look for in
-                      `name_comparator`.
+    :param var_names: Valid variables names to look for in `name_comparator`.
     """
-    for var_name in var_names:
-        if name_comparator == var_name:
-            return True
-    for var_name in var_names:
-        for code in _match_codes:
-            if name_comparator == var_name + '__' + code:
-                return True
-    return False
+    return name_comparator in _name_comparator_table(
+        tuple(sorted(var_names))
+    )
@@ -59,7 +59,7 @@ class Multinomial(
         """
         Return all possible permutations of X.
         """
-        return k_tuples_summing_to_n(k=len(self._p), n=self._n)
+        return list(k_tuples_summing_to_n(k=len(self._p), n=self._n))
 
     @property
     def n(self) -> int:
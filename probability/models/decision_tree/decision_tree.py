@@ -1,15 +1,105 @@
-from typing import Optional, List, overload, Union
+from typing import Optional, List, overload, Union, Dict, Tuple, Type
 
 from matplotlib.axes import Axes
 from mpl_format.axes.axis_utils import new_axes
 from networkx import DiGraph, draw_networkx_nodes, \
-    draw_networkx_edges, all_simple_paths, \
-    descendants_at_distance, draw_networkx_labels
+    draw_networkx_edges, draw_networkx_labels
+from numba import jit
+from numpy import argmin, argsort, array, bincount, empty, fromiter, full, \
+    inf, zeros
 from pandas import DataFrame
 
 from probability.models.decision_tree.nodes import \
     DecisionNode, ChanceNode, AmountNode
-from probability.models.utils import distribute_about_center
+from probability.models.utils import distribute_about_center_array
+
+
+@jit(nopython=True)
+def _solve_arrays(
+        decision_parents, decision_order, decision_depths,
+        chance_parents, chance_order, chance_depths,
+        chance_amounts, chance_p_failure,
+        amount_parents, amount_probs,
+        minimize
+):
+    """
+    Solve a Decision Tree stored as arrays of node values and parent
+    positions.
+
+    :param decision_parents: Position of each DecisionNode's parent ChanceNode,
+                             or -1 for the root.
+    :param decision_order: Positions of the DecisionNodes by descending depth.
+    :param decision_depths: Depth of each DecisionNode.
+    :param chance_parents: Position of each ChanceNode's parent DecisionNode.
+    :param chance_order: Positions of the ChanceNodes by descending depth.
+    :param chance_depths: Depth of each ChanceNode.
+    :param chance_amounts: Amount of each ChanceNode.
+    :param chance_p_failure: Probability of failure of each ChanceNode.
+    :param amount_parents: Position of each AmountNode's parent ChanceNode.
+    :param amount_probs: Probability of each AmountNode.
+    :param minimize: True to minimize amounts, False to maximize them.
+    :return: Total amount of each AmountNode, expected amount of each
+             ChanceNode and expected amount of each DecisionNode.
+    """
+    num_decisions = len(decision_parents)
+    num_chances = len(chance_parents)
+    num_amounts = len(amount_parents)
+
+    # 1) at each end point of the tree write down the net total cost
+    #    incurred if that end point is reached
+    chance_totals = chance_amounts.copy()
+    for c in range(num_chances - 1, -1, -1):
+        chance = chance_order[c]
+        # add the total of the chance node whose failure led to the
+        # decision, if there is one
+        prev_chance = decision_parents[chance_parents[chance]]
+        if prev_chance >= 0:
+            chance_totals[chance] += chance_totals[prev_chance]
+    amount_totals = empty(num_amounts)
+    for amount in range(num_amounts):
+        amount_totals[amount] = chance_totals[amount_parents[amount]]
+
+    # 2) propagate the expected payoff of every end point to its parent
+    #    chance node
+    chance_expected = zeros(num_chances)
+    for amount in range(num_amounts):
+        chance_expected[amount_parents[amount]] += (
+            amount_probs[amount] * amount_totals[amount]
+        )
+
+    # 3) work backwards computing the expected cost at all nodes and
+    #    choosing action at choice nodes where expected cost is lowest
+    decision_expected = full(num_decisions, inf if minimize else -inf)
+    c = 0
+    d = 0
+    while c < num_chances or d < num_decisions:
+        if c < num_chances:
+            depth = chance_depths[chance_order[c]]
+        else:
+            depth = decision_depths[decision_order[d]]
+        # select minimum cost from child chance nodes
+        while c < num_chances and chance_depths[chance_order[c]] == depth:
+            chance = chance_order[c]
+            decision = chance_parents[chance]
+            if (
+                    (minimize and
+                     chance_expected[chance] < decision_expected[decision]) or
+                    (not minimize and
+                     chance_expected[chance] > decision_expected[decision])
+            ):
+                decision_expected[decision] = chance_expected[chance]
+            c += 1
+        # propagate expected cost of failure to parent chance nodes
+        while d < num_decisions and decision_depths[decision_order[d]] >= depth:
+            decision = decision_order[d]
+            parent = decision_parents[decision]
+            if parent >= 0:
+                chance_expected[parent] += (
+                    chance_p_failure[parent] * decision_expected[decision]
+                )
+            d += 1
+
+    return amount_totals, chance_expected, decision_expected
 
 
 class DecisionTree(object):
@@ -29,15 +119,52 @@ class DecisionTree(object):
         """
         Create a new Probabilistic Decision Tree.
         """
-        self._graph = DiGraph()
+        self._graph: Optional[DiGraph] = None
+        self._chance_paths_cache: Optional[List[List[ChanceNode]]] = None
         self._root_node: Optional[DecisionNode] = None
         self._solved: bool = False
+        self._max_depth: int = 0
+        self._nodes_by_name: Dict[
+            str, List[Union[DecisionNode, ChanceNode, AmountNode]]
+        ] = {}
+        self._nodes_by_type: Dict[
+            Type[Union[DecisionNode, ChanceNode, AmountNode]],
+            List[Union[DecisionNode, ChanceNode, AmountNode]]
+        ] = {DecisionNode: [], ChanceNode: [], AmountNode: []}
+        self._nodes_by_type_depth: Dict[
+            Tuple[Type[Union[DecisionNode, ChanceNode, AmountNode]], int],
+            List[Union[DecisionNode, ChanceNode, AmountNode]]
+        ] = {}
+        # all nodes in order of addition, with the positions of each node's
+        # parent and children in the same list
+        self._nodes: List[Union[DecisionNode, ChanceNode, AmountNode]] = []
+        self._node_indices: Dict[
+            Union[DecisionNode, ChanceNode, AmountNode], int
+        ] = {}
+        self._parents: List[int] = []
+        self._children: List[List[int]] = []
+        # position of each node in the list of nodes of its type, and the
+        # position of each node's parent in the list of nodes of its type
+        self._type_indices: Dict[
+            Union[DecisionNode, ChanceNode, AmountNode], int
+        ] = {}
+        self._parent_indices: Dict[
+            Type[Union[DecisionNode, ChanceNode, AmountNode]], List[int]
+        ] = {DecisionNode: [], ChanceNode: [], AmountNode: []}
 
     @property
     def graph(self) -> DiGraph:
         """
-        Return the wrapped networkx DiGraph object.
+        Return a networkx DiGraph of the Tree.
         """
+        if self._graph is None:
+            self._graph = DiGraph()
+            self._graph.add_nodes_from(self._nodes)
+            self._graph.add_edges_from(
+                (self._nodes[parent], node)
+                for node, parent in zip(self._nodes, self._parents)
+                if parent >= 0
+            )
         return self._graph
 
     @property
@@ -45,11 +172,65 @@ class DecisionTree(object):
         """
         Return the maximum depth of any DecisionNode in the Tree,
         """
-        decision_nodes = self.decision_nodes()
-        if len(decision_nodes):
-            return max([node.depth for node in decision_nodes])
+        return self._max_depth
+
+    def _register_node(
+            self, node: Union[DecisionNode, ChanceNode, AmountNode],
+            parent: Optional[Union[DecisionNode, ChanceNode]]
+    ):
+        """
+        Add a new node to the name, type and depth lookups of the Tree.
+
+        :param node: The DecisionNode, ChanceNode or AmountNode being added.
+        :param parent: The parent of the node, or None for the root node.
+        """
+        node_type = next(
+            node_type for node_type in self._nodes_by_type.keys()
+            if isinstance(node, node_type)
+        )
+        node_index = len(self._nodes)
+        self._nodes.append(node)
+        self._node_indices[node] = node_index
+        self._children.append([])
+        if parent is None:
+            self._parents.append(-1)
         else:
-            return 0
+            parent_index = self._node_indices[parent]
+            self._parents.append(parent_index)
+            self._children[parent_index].append(node_index)
+        self._graph = None
+        self._chance_paths_cache = None
+        self._type_indices[node] = len(self._nodes_by_type[node_type])
+        self._parent_indices[node_type].append(
+            -1 if parent is None else self._type_indices[parent]
+        )
+        self._nodes_by_name.setdefault(node.name, []).append(node)
+        self._nodes_by_type[node_type].append(node)
+        self._nodes_by_type_depth.setdefault(
+            (node_type, node.depth), []
+        ).append(node)
+        if node_type is DecisionNode:
+            self._max_depth = max(self._max_depth, node.depth)
+
+    def _chance_paths(self) -> List[List[ChanceNode]]:
+        """
+        Return the ChanceNodes on the path from the root node to each
+        ChanceNode (inclusive), in the order the ChanceNodes were added.
+        """
+        if self._chance_paths_cache is None:
+            decision_parents = self._parent_indices[DecisionNode]
+            chance_parents = self._parent_indices[ChanceNode]
+            chance_paths = []
+            for chance_node, parent_index in zip(
+                    self._nodes_by_type[ChanceNode], chance_parents
+            ):
+                # the chance node whose failure led to the parent decision
+                # is always added to the tree before this one
+                prev_index = decision_parents[parent_index]
+                prev_path = chance_paths[prev_index] if prev_index >= 0 else []
+                chance_paths.append(prev_path + [chance_node])
+            self._chance_paths_cache = chance_paths
+        return self._chance_paths_cache
 
     def _get_layout(self) -> dict:
         """
@@ -67,83 +248,86 @@ class DecisionTree(object):
         }
 
         max_depth = self.max_depth
-        nodes = {}
-        for depth in range(1, max_depth + 1):
-            nodes[(DecisionNode, depth)] = self.decision_nodes(depth)
-            nodes[(ChanceNode, depth)] = self.chance_nodes(depth)
-            nodes[(AmountNode, depth)] = self.amount_nodes(depth)
-
+        nodes = self._nodes_by_type_depth
         max_width = max(len(value) for value in nodes.values())
 
         layout = {}
-        for node in self._graph.nodes():
-            node_type = type(node)
-            node_list = nodes[(node_type, node.depth)]
-            x = (node.depth + x_add[node_type]) / (max_depth * 3)
-            y = distribute_about_center(
-                index=node_list.index(node),
+        for (node_type, depth), node_list in nodes.items():
+            x = (depth + x_add[node_type]) / (max_depth * 3)
+            ys = distribute_about_center_array(
                 size=len(node_list),
                 max_loc=max_width - 1,
                 max_size=max_width
             ) + y_add[node_type]
-            layout[node] = [x, y]
+            for node, y in zip(node_list, ys.tolist()):
+                layout[node] = [x, y]
         return layout
 
+    def _typed_node(
+            self, node_type: Type[Union[DecisionNode, ChanceNode, AmountNode]],
+            name: str, depth: Optional[int] = None
+    ) -> Union[DecisionNode, ChanceNode, AmountNode]:
+        """
+        Return the first node of the given type with the given name.
+
+        :param node_type: One of DecisionNode, ChanceNode or AmountNode.
+        :param name: The name of the node.
+        :param depth: Optional depth filter in case node names are only unique
+                      by depth.
+        """
+        node = next(
+            (node for node in self._nodes_by_name.get(name, [])
+             if isinstance(node, node_type)
+             and (depth is None or node.depth == depth)),
+            None
+        )
+        if node is None:
+            raise ValueError(f'No {node_type.__name__} named {name}')
+        return node
+
     def decision_nodes(self, depth: Optional[int] = None) -> List[DecisionNode]:
         """
         Return a list of all DecisionNodes in the DecisionTree.
         """
-        nodes = [node for node in self._graph.nodes()
-                 if isinstance(node, DecisionNode)]
-        if depth is not None:
-            nodes = [node for node in nodes if node.depth == depth]
-        return nodes
+        if depth is None:
+            return list(self._nodes_by_type[DecisionNode])
+        return list(self._nodes_by_type_depth.get((DecisionNode, depth), []))
 
     def decision_node(
             self, name: str, depth: Optional[int] = None
     ) -> DecisionNode:
 
-        decision_nodes = self.decision_nodes(depth=depth)
-        return [node for node in decision_nodes
-                if node.name == name][0]
+        return self._typed_node(node_type=DecisionNode, name=name, depth=depth)
 
     def chance_nodes(self, depth: Optional[int] = None) -> List[ChanceNode]:
         """
         Return a list of all ChanceNodes in the DecisionTree.
         """
-        nodes = [node for node in self._graph.nodes()
-                 if isinstance(node, ChanceNode)]
-        if depth is not None:
-            nodes = [node for node in nodes if node.depth == depth]
-        return nodes
+        if depth is None:
+            return list(self._nodes_by_type[ChanceNode])
+        return list(self._nodes_by_type_depth.get((ChanceNode, depth), []))
 
     def chance_node(
             self, name: str,
             depth: Optional[int] = None
     ) -> ChanceNode:
 
-        chance_nodes = self.chance_nodes(depth=depth)
-        return [node for node in chance_nodes
-                if node.name == name][0]
+        return self._typed_node(node_type=ChanceNode, name=name, depth=depth)
 
     def amount_nodes(self, depth: Optional[int] = None) -> List[AmountNode]:
         """
         Return a list of all AmountNodes in the DecisionTree.
         """
-        nodes = [node for node in self._graph.nodes()
-                 if isinstance(node, AmountNode)]
-        if depth is not None:
-            nodes = [node for node in nodes if node.depth == depth]
-        return nodes
+        if depth is None:
+            return list(self._nodes_by_type[AmountNode])
+        return list(self._nodes_by_type_depth.get((AmountNode, depth), []))
 
     def amount_node(
             self, name: str,
             depth: Optional[int] = None
     ) -> AmountNode:
 
-        amount_nodes = self.amount_nodes(depth=depth)
-        return [node for node in amount_nodes
-                if node.name == name][0]
+        return self._typed_node(node_type=AmountNode, name=name, depth=depth)
 
     def node(self, name: str, depth: Optional[int] = None):
         """
@@ -153,8 +337,7 @@ class DecisionTree(object):
         :param depth: Optional depth filter in case node names are only unique
                       by depth.
         """
-        nodes = list([node for node in self._graph.nodes()
-                      if node.name == name])
+        nodes = self._nodes_by_name.get(name, [])
         if depth is not None:
             nodes = [node for node in nodes if node.depth == depth]
         if len(nodes) == 1:
@@ -173,7 +356,7 @@ class DecisionTree(object):
         """
         return {
             node: node.str_amount
-            for node in self._graph.nodes()
+            for node in self._nodes
         }
 
     def node_names_dict(self) -> dict:
@@ -182,14 +365,14 @@ class DecisionTree(object):
         """
         return {
             node: node.name
-            for node in self._graph.nodes()
+            for node in self._nodes
         }
 
     def node_names(self) -> List[str]:
         """
         Return a list of all the Node names in the Tree.
         """
-        return [node.name for node in self._graph.nodes()]
+        return [node.name for node in self._nodes]
 
     @overload
     def parent(self, node: AmountNode) -> ChanceNode:
@@ -204,7 +387,10 @@ class DecisionTree(object):
         pass
 
     def parent(self, node):
-        return list(self._graph.predecessors(node))[0]
+        parent_index = self._parents[self._node_indices[node]]
+        if parent_index < 0:
+            return None
+        return self._nodes[parent_index]
 
     @overload
     def children(self, node: DecisionNode) -> List[ChanceNode]:
@@ -217,7 +403,8 @@ class DecisionTree(object):
         pass
 
     def children(self, node):
-        return list(descendants_at_distance(self._graph, node, 1))
+        return [self._nodes[child_index]
+                for child_index in self._children[self._node_indices[node]]]
 
     def add_decision_node(
             self, decision_node: DecisionNode,
@@ -234,12 +421,10 @@ class DecisionTree(object):
             raise ValueError('Must give parent if tree already has a root node')
         if decision_node.depth is None:
             raise ValueError('DecisionNode must have depth assigned.')
-        if parent is not None and parent not in self._graph.nodes():
+        if parent is not None and parent not in self._node_indices:
             raise ValueError(f'ChanceNode {parent} is not in the Tree.')
-        self._graph.add_node(decision_node)
-        if parent is not None:
-            self._graph.add_edge(parent, decision_node)
-        else:
+        self._register_node(decision_node, parent)
+        if parent is None:
             self._root_node = decision_node
         self._solved = False
 
@@ -254,7 +439,7 @@ class DecisionTree(object):
                             on failure. Leave as None if this is the first
                             Decision.
         """
-        if name in self.node_names():
+        if name in self._nodes_by_name:
             raise ValueError(f'{name} already exists in Tree')
 
         parent: Optional[ChanceNode] = (
@@ -282,10 +467,9 @@ class DecisionTree(object):
         """
         if chance_node.depth is None:
             raise ValueError('ChanceNode must have depth assigned.')
-        if parent not in self._graph.nodes():
+        if parent not in self._node_indices:
             raise ValueError(f'DecisionNode {parent} is not in the Tree.')
-        self._graph.add_node(chance_node)
-        self._graph.add_edge(parent, chance_node)
+        self._register_node(chance_node, parent)
         self._solved = False
         return chance_node
 
@@ -307,10 +491,9 @@ class DecisionTree(object):
         :param final: Set to True to add a failure as well as a success
                       AmountNode.
         """
-        node_names = self.node_names()
-        if name in node_names:
+        if name in self._nodes_by_name:
             raise ValueError(f'{name} already exists in Tree')
-        if parent_name not in node_names:
+        if parent_name not in self._nodes_by_name:
             raise ValueError(
                 f'DecisionNode named {parent_name} is not in the Tree.'
             )
@@ -355,10 +538,9 @@ class DecisionTree(object):
         """
         if amount_node.depth is None:
             raise ValueError('AmountNode must have depth assigned.')
-        if parent not in self._graph.nodes():
+        if parent not in self._node_indices:
             raise ValueError(f'ChanceNode {parent} is not in the Tree.')
-        self._graph.add_node(amount_node)
-        self._graph.add_edge(parent, amount_node)
+        self._register_node(amount_node, parent)
         self._solved = False
         return amount_node
 
@@ -369,44 +551,68 @@ class DecisionTree(object):
         :param minimize: True to minimize amounts, i.e. amounts are costs, or
                          False to maximize amounts, i.e. amounts are rewards.
         """
-        if minimize:
-            opt_func = min
-        else:
-            opt_func = max
-
-        # 1) at each end point of the tree write down the net total cost
-        #    incurred if that end point is reached
-        for amount_node in self.amount_nodes():
-            path_to_node = list(all_simple_paths(
-                self._graph, self._root_node, amount_node
-            ))[0]  # path from first decision node to amount node
-            total_amount = 0
-            for node in path_to_node:
-                if isinstance(node, ChanceNode):
-                    total_amount += node.amount
-            amount_node: AmountNode = path_to_node[-1]
-            amount_node.total_amount = total_amount
+        # copy node values and parent positions into arrays, one element
+        # per node of each type
+        decision_nodes = self._nodes_by_type[DecisionNode]
+        chance_nodes = self._nodes_by_type[ChanceNode]
+        amount_nodes = self._nodes_by_type[AmountNode]
+        decision_parents = array(self._parent_indices[DecisionNode], dtype=int)
+        decision_depths = fromiter(
+            (node.depth for node in decision_nodes),
+            dtype=int, count=len(decision_nodes)
+        )
+        chance_parents = array(self._parent_indices[ChanceNode], dtype=int)
+        chance_depths = fromiter(
+            (node.depth for node in chance_nodes),
+            dtype=int, count=len(chance_nodes)
+        )
+        chance_amounts = fromiter(
+            (node.amount for node in chance_nodes),
+            dtype=float, count=len(chance_nodes)
+        )
+        chance_p_failure = fromiter(
+            (node.p_failure for node in chance_nodes),
+            dtype=float, count=len(chance_nodes)
+        )
+        amount_parents = array(self._parent_indices[AmountNode], dtype=int)
+        amount_probs = fromiter(
+            (node.probability for node in amount_nodes),
+            dtype=float, count=len(amount_nodes)
+        )
+        num_options = bincount(chance_parents, minlength=len(decision_nodes))
+        if (num_options == 0).any():
+            raise ValueError(
+                f'DecisionNode {decision_nodes[argmin(num_options)].name} '
+                f'has no options.'
+            )
 
-        # 2) work backwards computing the expected cost at all nodes and
-        #    choosing action at choice nodes where expected cost is lowest
-        for depth in range(self.max_depth, 0, -1):
-            for amount_node in self.amount_nodes(depth):
-                # propagate expected payoff to parent chance node
-                parent = self.parent(amount_node)
-                parent.expected_amount += (
-                    amount_node.probability * amount_node.total_amount
-                )
-            for decision_node in self.decision_nodes(depth):
-                # select minimum cost from child chance nodes
-                children = self.children(decision_node)
-                decision_node.expected_amount = opt_func([
-                    child.expected_amount for child in children
-                ])
-                if depth > 1:
-                    parent = self.parent(decision_node)
-                    parent.expected_amount += (
-                        parent.p_failure * decision_node.expected_amount
-                    )
+        amount_totals, chance_expected, decision_expected = _solve_arrays(
+            decision_parents=decision_parents,
+            decision_order=argsort(-decision_depths, kind='stable'),
+            decision_depths=decision_depths,
+            chance_parents=chance_parents,
+            chance_order=argsort(-chance_depths, kind='stable'),
+            chance_depths=chance_depths,
+            chance_amounts=chance_amounts,
+            chance_p_failure=chance_p_failure,
+            amount_parents=amount_parents,
+            amount_probs=amount_probs,
+            minimize=minimize
+        )
+
+        # write results back to the nodes
+        for amount_node, total_amount in zip(
+                amount_nodes, amount_totals.tolist()
+        ):
+            amount_node.total_amount = total_amount
+        for chance_node, expected_amount in zip(
+                chance_nodes, chance_expected.tolist()
+        ):
+            chance_node.expected_amount = expected_amount
+        for decision_node, expected_amount in zip(
+                decision_nodes, decision_expected.tolist()
+        ):
+            decision_node.expected_amount = expected_amount
         self._solved = True
 
     def amounts(self, require_success: bool = False) -> DataFrame:
@@ -420,13 +626,10 @@ class DecisionTree(object):
             raise PermissionError(
                 "Can't calculate amounts for an unsolved tree."
             )
+        chance_paths = self._chance_paths()
         results = []
-        for amount_node in self.amount_nodes():
-            path_to_node = list(all_simple_paths(
-                self._graph, self._root_node, amount_node
-            ))[0]
-            chance_nodes = [c for c in path_to_node
-                            if isinstance(c, ChanceNode)]
+        for parent_index in self._parent_indices[AmountNode]:
+            chance_nodes = chance_paths[parent_index]
             if chance_nodes[-1].p_success != 1 and require_success:
                 continue
             result = {}
@@ -448,31 +651,32 @@ class DecisionTree(object):
         :param node_labels: One of {'name', 'amount', None}
         :param ax: Optional matplotlib axes.
         """
+        if node_labels is None:
+            labels = None
+        elif node_labels == 'name':
+            labels = self.node_names_dict()
+        elif node_labels == 'amount':
+            labels = self.node_amounts_dict()
+        else:
+            raise ValueError()
         ax = ax or new_axes()
         pos = self._get_layout()
-        for nodes, node_shape, node_color in zip(
-                (self.decision_nodes(),
-                 self.chance_nodes(),
-                 self.amount_nodes()),
+        graph = self.graph
+        for node_type, node_shape, node_color in zip(
+                (DecisionNode, ChanceNode, AmountNode),
                 ('s', 'o', 'H'),
                 ('r', 'b', 'g')
         ):
             draw_networkx_nodes(
-                G=self._graph, pos=pos, ax=ax,
-                nodelist=nodes,
+                G=graph, pos=pos, ax=ax,
+                nodelist=self._nodes_by_type[node_type],
                 node_shape=node_shape, node_color=node_color, alpha=0.5,
             )
-            if node_labels is not None:
-                if node_labels == 'name':
-                    labels = self.node_names_dict()
-                elif node_labels == 'amount':
-                    labels = self.node_amounts_dict()
-                else:
-                    raise ValueError()
-                draw_networkx_labels(
-                    G=self._graph, pos=pos, ax=ax,
-                    labels=labels, font_size=10,
-                )
-        draw_networkx_edges(G=self._graph, pos=pos,
+        if labels is not None:
+            draw_networkx_labels(
+                G=graph, pos=pos, ax=ax,
+                labels=labels, font_size=10,
+            )
+        draw_networkx_edges(G=graph, pos=pos,
                             ax=ax, edge_color='gray')
         return ax
@@ -5,6 +5,8 @@ class NodeMixin(object):
     """
     Base Node object with universal properties.
     """
+    __slots__ = ()
+
     name: str
     depth: int
 
@@ -13,6 +15,8 @@ class DecisionNode(NodeMixin, object):
     """
     A Node representing a Decision with a number of Choices.
     """
+    __slots__ = ('name', 'depth', 'expected_amount')
+
     def __init__(
             self,
             name: str,
@@ -38,6 +42,8 @@ class ChanceNode(NodeMixin, object):
     A Node representing a choice with a fixed chance of success and a fixed
     cost or reward (amount).
     """
+    __slots__ = ('name', 'p_success', 'amount', 'depth', 'expected_amount')
+
     def __init__(
             self,
             name: str,
@@ -72,6 +78,8 @@ class AmountNode(NodeMixin, object):
     """
     A Node representing a Cost or Reward if a choice is successful.
     """
+    __slots__ = ('name', 'depth', 'probability', 'total_amount')
+
     def __init__(
             self,
             name: str,
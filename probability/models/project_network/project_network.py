@@ -1,14 +1,16 @@
-from typing import Optional, List, Union
+from collections import defaultdict
+from typing import Optional, List, Union, Dict
 
 from matplotlib.axes import Axes
 from mpl_format.axes.axis_utils import new_axes
 from networkx import DiGraph, draw_networkx_nodes, draw_networkx_labels, \
     draw_networkx_edges, \
-    shortest_path, draw_networkx_edge_labels, all_simple_paths
+    single_source_shortest_path_length, draw_networkx_edge_labels, \
+    all_simple_paths, dag_longest_path_length, ancestors, descendants
 from pandas import DataFrame
 
 from probability.models.project_network.project_task import ProjectTask
-from probability.models.utils import distribute_about_center
+from probability.models.utils import distribute_about_center_array
 
 
 class ProjectNetwork(object):
@@ -20,8 +22,10 @@ class ProjectNetwork(object):
         Create a new ProjectNetwork.
         """
         self._graph: DiGraph = DiGraph()
-        self._graph.add_node(ProjectTask('START'))
-        self._graph.add_node(ProjectTask('END'))
+        self._name_to_task: Dict[str, ProjectTask] = {}
+        for task in (ProjectTask('START'), ProjectTask('END')):
+            self._graph.add_node(task)
+            self._name_to_task[task.name] = task
 
     @property
     def _task_name_dict(self) -> dict:
@@ -49,30 +53,30 @@ class ProjectNetwork(object):
         """
         Calculate the layout for drawing the network.
         """
+        start_distances = single_source_shortest_path_length(
+            self._graph, self.task('START')
+        )
         task_distances = {
-            task: len(shortest_path(self._graph, self.task('START'), task)) - 1
+            task: start_distances[task]
             for task in self._graph.nodes()
         }
-        max_distance = max([distance for distance in task_distances.values()])
+        max_distance = max(task_distances.values())
         x = {
             task: distance / max_distance
             for task, distance in task_distances.items()
         }
-        num_at_distance = {
-            distance: sum([d == distance for d in task_distances.values()])
-            for distance in range(max_distance + 1)
-        }
-        max_num_at_distance = max(num_at_distance.values())
+        distance_tasks = defaultdict(list)
+        for task, distance in task_distances.items():
+            distance_tasks[distance].append(task)
+        max_num_at_distance = max(len(tasks)
+                                  for tasks in distance_tasks.values())
         y = {}
-        for distance in range(max_distance + 1):
-            distance_tasks = {k: v for k, v in task_distances.items()
-                              if v == distance}
-            for t, (task, task_distance) in enumerate(distance_tasks.items()):
-                y[task] = distribute_about_center(
-                    index=t,
-                    size=num_at_distance[task_distance],
-                    max_size=max_num_at_distance
-                )
+        for tasks in distance_tasks.values():
+            ys = distribute_about_center_array(
+                size=len(tasks),
+                max_size=max_num_at_distance
+            )
+            y.update(zip(tasks, ys.tolist()))
         return {
             task: [x[task], y[task]]
             for task in task_distances.keys()
@@ -84,17 +88,17 @@ class ProjectNetwork(object):
 
         :param name: The name of the ProjectTask.
         """
-        if name not in self.task_names:
+        try:
+            return self._name_to_task[name]
+        except KeyError:
             raise ValueError(f'No Tasks named {name}.')
-        return [node for node in self._graph.nodes()
-                if node.name == name][0]
 
     @property
     def task_names(self) -> List[str]:
         """
         Return a list of names of each Task in the Network.
         """
-        return [node.name for node in self._graph.nodes()]
+        return list(self._name_to_task.keys())
 
     @property
     def tasks(self) -> List[ProjectTask]:
@@ -113,8 +117,7 @@ class ProjectNetwork(object):
         :param parents: The name(s) of the Tasks the ProjectTask depends on.
         :param end: Set to True if this Task has no following ProjectTask.
         """
-        existing_names = self.task_names
-        if task.name in existing_names:
+        if task.name in self._name_to_task:
             raise ValueError(f'Task named {task.name} already exists.')
 
         if parents is None:
@@ -122,9 +125,10 @@ class ProjectNetwork(object):
         elif isinstance(parents, str):
             parents = [parents]
 
+        parent_nodes = [self.task(parent) for parent in parents]
         self._graph.add_node(task)
-        for parent in parents:
-            parent_node = self.task(parent)
+        self._name_to_task[task.name] = task
+        for parent_node in parent_nodes:
             self._graph.add_edge(parent_node, task)
         if end:
             self._graph.add_edge(task, self.task('END'))
@@ -146,20 +150,39 @@ class ProjectNetwork(object):
         """
         Return a DataFrame with columns of 'path' and 'length'.
         """
+        weights = {
+            (u, v): data.get('weight', 0.0)
+            for u, v, data in self._graph.edges(data=True)
+        }
         paths = []
         for path in all_simple_paths(
                 self._graph, self.task('START'), self.task('END')
         ):
-            path_length = 0.0
-            for n in range(len(path) - 1):
-                if 'weight' in self._graph[path[n]][path[n + 1]].keys():
-                    path_length += self._graph[path[n]][path[n + 1]]['weight']
+            path_length = sum(
+                (weights[edge] for edge in zip(path[: -1], path[1:])), 0.0
+            )
             paths.append({
                 'path': tuple(node.name for node in path),
                 'length': path_length
             })
         return DataFrame(paths)
 
+    def critical_path_length(self) -> float:
+        """
+        Return the length of the longest path from START to END, without
+        enumerating every path.
+        """
+        start = self.task('START')
+        end = self.task('END')
+        # only tasks on a path from START to END
+        nodes = (
+            (descendants(self._graph, start) | {start}) &
+            (ancestors(self._graph, end) | {end})
+        )
+        return dag_longest_path_length(
+            self._graph.subgraph(nodes), weight='weight', default_weight=0
+        )
+
     def draw(self, ax: Optional[Axes]) -> Axes:
         """
         Draw the network.
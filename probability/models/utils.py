@@ -1,5 +1,7 @@
 from typing import Optional
 
+from numpy import arange, ndarray
+
 
 def distribute_about_center(index: int, size: int,
                             max_loc: float = 1.0,
@@ -24,6 +26,26 @@ def distribute_about_center(index: int, size: int,
     return min_loc + index * spacing
 
 
+def distribute_about_center_array(size: int,
+                                  max_loc: float = 1.0,
+                                  max_size: Optional[int] = None) -> ndarray:
+    """
+    Get the coordinates from between 0 and 1 of every item in a collection.
+
+    :param size: The number of items in the collection.
+    :param max_loc: The maximum location of an item.
+    :param max_size: The maximum number of items that can appear in any
+                     collection.
+                     Use if all items in all collections should be equally
+                     spaced.
+                     Leave as None to give each collection its own spacing.
+    """
+    return distribute_about_center(
+        index=arange(size), size=size,
+        max_loc=max_loc, max_size=max_size
+    )
+
+
 def loop_variable(variable, length: int) -> list:
     """
     Cycle a variable or list of variables until they are the given length.
@@ -1,64 +1,96 @@
-from itertools import permutations
-from typing import List, Tuple
+from functools import lru_cache
+from itertools import combinations
+from typing import Tuple
 
+from numba import jit
+from numpy import ndarray
 from pandas import Series
 
 
-def k_tuples_summing_to_n(k, n) -> List[Tuple[int]]:
+@lru_cache(maxsize=None)
+def k_tuples_summing_to_n(k, n) -> Tuple[Tuple[int, ...], ...]:
     """
-    Return a list of k-tuples of values that sum to n.
+    Return a tuple of k-tuples of non-negative integers that sum to n, in
+    lexicographic order.
+    Results are cached, so the returned tuple is shared between calls.
 
     :param k: The number of items in each tuple.
-    :param n: The
-
-    Calculation time increases exponentially with k
-    - not recommended to use for k > 3 if n >> k.
-    """
-    def valid(val):
-        return sum(val) == n
-
-    return list(filter(valid, list(permutations(range(n + 1), k))))
+    :param n: The total that the items of each tuple sum to.
+    """
+    if k == 0:
+        return ((),) if n == 0 else ()
+    # place k - 1 bars among n + k - 1 positions - the gaps between the bars
+    # are the items of each tuple
+    num_positions = n + k - 1
+    tuples = []
+    for bars in combinations(range(num_positions), k - 1):
+        bounds = (-1,) + bars + (num_positions,)
+        tuples.append(tuple(
+            bounds[i + 1] - bounds[i] - 1 for i in range(k)
+        ))
+    return tuple(tuples)
 
 
 def all_are_none(*args) -> bool:
     """
     Return True if every arg is None.
     """
-    return all([arg is None for arg in args])
+    return all(arg is None for arg in args)
 
 
 def none_are_none(*args) -> bool:
     """
     Return True if no arg is None.
     """
-    return not any([arg is None for arg in args])
+    return all(arg is not None for arg in args)
 
 
 def any_are_not_none(*args) -> bool:
     """
     Return True if any arg is not None.
     """
-    return any([arg is not None for arg in args])
+    return any(arg is not None for arg in args)
 
 
 def any_are_none(*args) -> bool:
     """
     Return True if any arg is None.
     """
-    return any([arg is None for arg in args])
+    return any(arg is None for arg in args)
 
 
 def one_is_none(*args) -> bool:
     """
     Return True if exactly one arg is None.
     """
-    return sum([arg is None for arg in args]) == 1
+    num_none = 0
+    for arg in args:
+        if arg is None:
+            num_none += 1
+            if num_none > 1:
+                return False
+    return num_none == 1
+
+
+@jit(nopython=True)
+def _values_are_binary(values: ndarray) -> bool:
+    """
+    Return True if every value of the numeric array is 0 or 1, stopping at the
+    first value that is not.
+    """
+    for value in values:
+        if value != 0 and value != 1:
+            return False
+    return True
 
 
 def series_is_binary(data: Series) -> bool:
     """
     Return True if every value of the Series is 0 or 1.
     """
+    values = data.to_numpy()
+    if values.dtype.kind in 'biuf':
+        return _values_are_binary(values)
     return (
         set(data.unique()).issubset({0, 1})
     )
@@ -73,7 +105,8 @@ def is_scalar(arg) -> bool:
 
 def num_format(number: float, max_dp: int) -> str:
 
-    for ndp in range(max_dp):
-        if round(number, ndp) == number:
-            return f'{number:0.{ndp}f}'
-    return f'{number:0.{max_dp}f}'
+    formatted = f'{number:0.{max_dp}f}'
+    if '.' in formatted:
+        # drop trailing zeros of the fractional part
+        formatted = formatted.rstrip('0').rstrip('.')
+    return formatted
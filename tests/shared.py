@@ -31,18 +31,16 @@ def series_are_equivalent(series_1: Series, series_2: Series) -> bool:
     N.B. where series 1 has p(0), the associated item may be missing from
     series 2.
     """
-    d1 = series_1.copy().reset_index()
-    cols_1 = sorted([c for c in d1.columns if c != 'p'])
-    cols_p = cols_1 + ['p']
-    s1 = d1[cols_p].set_index(cols_1)['p']
-    d2 = series_2.copy().reset_index()
-    cols_2 = sorted([c for c in d2.columns if c != 'p'])
-    if cols_1 != cols_2:
+    names = sorted(series_1.index.names)
+    if names != sorted(series_2.index.names):
         return False
-    s2 = d2[cols_p].set_index(cols_2)['p']
-    for k, v in s1.iteritems():
-        if v == 0:
-            continue
-        if k not in s2.keys() or abs(s2[k] - v) > 1e-10:
-            return False
-    return True
+    if series_1.index.nlevels > 1:
+        series_1 = series_1.reorder_levels(names)
+        series_2 = series_2.reorder_levels(names)
+    series_1 = series_1[series_1 != 0]
+    if not series_1.index.isin(series_2.index).all():
+        return False
+    differences = abs(
+        series_2.reindex(series_1.index).to_numpy() - series_1.to_numpy()
+    )
+    return not (differences > 1e-10).any()
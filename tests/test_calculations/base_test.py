@@ -3,25 +3,31 @@ from unittest.case import TestCase
 from pandas import Series, DataFrame
 
 from probability.distributions import Beta, Dirichlet
+from probability.distributions.mixins.rv_mixins import NUM_SAMPLES_COMPARISON
 
 
 class BaseTest(TestCase):
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
 
-        self.b1 = Beta(700, 300)
-        self.b2 = Beta(600, 400)
-        self.b3 = Beta(500, 500)
-        self.d1 = Dirichlet([500, 300, 200])
-        self.d2 = Dirichlet({'x': 100, 'y': 200, 'z': 300})
-        self.b1__mul__b2 = self.b1 * self.b2
-        self.b3__mul__b1__mul__b2 = self.b3 * self.b1__mul__b2
-        self.b1__mul__comp__b1 = self.b1 * (1 - self.b1)
-        self.b_series = Series({
-            'b1': self.b1, 'b2': self.b2, 'b3': self.b3
+        cls.b1 = Beta(700, 300)
+        cls.b2 = Beta(600, 400)
+        cls.b3 = Beta(500, 500)
+        cls.d1 = Dirichlet([500, 300, 200])
+        cls.d2 = Dirichlet({'x': 100, 'y': 200, 'z': 300})
+        cls.b1_samples = cls.b1.rvs(NUM_SAMPLES_COMPARISON)
+        cls.b2_samples = cls.b2.rvs(NUM_SAMPLES_COMPARISON)
+        cls.d1_samples = cls.d1.rvs(NUM_SAMPLES_COMPARISON, full_name=True)
+        cls.d2_samples = cls.d2.rvs(NUM_SAMPLES_COMPARISON, full_name=True)
+        cls.b1__mul__b2 = cls.b1 * cls.b2
+        cls.b3__mul__b1__mul__b2 = cls.b3 * cls.b1__mul__b2
+        cls.b1__mul__comp__b1 = cls.b1 * (1 - cls.b1)
+        cls.b_series = Series({
+            'b1': cls.b1, 'b2': cls.b2, 'b3': cls.b3
         })
-        self.b_frame = DataFrame({
-            'c1': {'r1': self.b1, 'r2': self.b2},
-            'c2': {'r1': self.b2, 'r2': self.b3}
+        cls.b_frame = DataFrame({
+            'c1': {'r1': cls.b1, 'r2': cls.b2},
+            'c2': {'r1': cls.b2, 'r2': cls.b3}
         })
-        self.float_series = Series({'$100': 0.8, '$200': 0.6})
+        cls.float_series = Series({'$100': 0.8, '$200': 0.6})
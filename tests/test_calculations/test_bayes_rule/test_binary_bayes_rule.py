@@ -9,17 +9,18 @@ from probability.distributions import Beta
 
 class TestBinaryBayesRule(TestCase):
 
-    def setUp(self) -> None:
-
-        self.prior_float = 0.3
-        self.prior_beta = Beta(1 + 3, 1 + 7)
-        self.prior_float_map = Series({'$100': 0.3, '$200': 0.2})
-        self.prior_beta_map = Series({'$100': Beta(1 + 3, 1 + 7),
-                                      '$200': Beta(1 + 2, 1 + 8)})
-        self.likelihood_float = 0.8
-        self.likelihood_float_map = Series({'$100': 0.8, '$200': 0.6})
-        self.likelihood_beta = Beta(1 + 8, 1 + 2)
-        self.likelihood_beta_map = Series({
+    @classmethod
+    def setUpClass(cls) -> None:
+
+        cls.prior_float = 0.3
+        cls.prior_beta = Beta(1 + 3, 1 + 7)
+        cls.prior_float_map = Series({'$100': 0.3, '$200': 0.2})
+        cls.prior_beta_map = Series({'$100': Beta(1 + 3, 1 + 7),
+                                     '$200': Beta(1 + 2, 1 + 8)})
+        cls.likelihood_float = 0.8
+        cls.likelihood_float_map = Series({'$100': 0.8, '$200': 0.6})
+        cls.likelihood_beta = Beta(1 + 8, 1 + 2)
+        cls.likelihood_beta_map = Series({
             '$100': Beta(1 + 8, 1 + 2),
             '$200': Beta(1 + 6, 1 + 4)
         })
@@ -50,10 +51,12 @@ class TestBinaryBayesRule(TestCase):
 
         posterior = BinaryBayesRule(prior=self.prior_float,
                                     likelihood=self.likelihood_beta).posterior()
+        prior_name = str(self.prior_float)
+        likelihood_name = str(self.likelihood_beta)
         self.assertEqual(
-            f'({str(self.prior_float)} * {str(self.likelihood_beta)}) / '
-            f'(({str(self.prior_float)} * {str(self.likelihood_beta)}) + '
-            f'({1 - self.prior_float} * (1 - {str(self.likelihood_beta)})))',
+            f'({prior_name} * {likelihood_name}) / '
+            f'(({prior_name} * {likelihood_name}) + '
+            f'({1 - self.prior_float} * (1 - {likelihood_name})))',
             posterior.name
         )
         output = posterior.output()
@@ -64,11 +67,13 @@ class TestBinaryBayesRule(TestCase):
 
         posterior = BinaryBayesRule(prior=self.prior_float,
                                     likelihood=self.likelihood_beta_map).posterior()
+        prior_name = str(self.prior_float)
         for key, likelihood in self.likelihood_beta_map.items():
+            likelihood_name = str(likelihood)
             self.assertEqual(
-                f'({str(self.prior_float)} * {str(likelihood)}) / '
-                f'(({str(self.prior_float)} * {str(likelihood)}) + '
-                f'({1 - self.prior_float} * (1 - {str(likelihood)})))',
+                f'({prior_name} * {likelihood_name}) / '
+                f'(({prior_name} * {likelihood_name}) + '
+                f'({1 - self.prior_float} * (1 - {likelihood_name})))',
                 posterior[key].name
             )
 
@@ -78,10 +83,12 @@ class TestBinaryBayesRule(TestCase):
             prior=self.prior_beta,
             likelihood=self.likelihood_float
         ).posterior()
+        prior_name = str(self.prior_beta)
+        likelihood_name = str(self.likelihood_float)
         self.assertEqual(
-            f'({str(self.prior_beta)} * {str(self.likelihood_float)}) / '
-            f'(({str(self.prior_beta)} * {str(self.likelihood_float)}) + '
-            f'((1 - {self.prior_beta}) * {str(1 - self.likelihood_float)}))',
+            f'({prior_name} * {likelihood_name}) / '
+            f'(({prior_name} * {likelihood_name}) + '
+            f'((1 - {prior_name}) * {str(1 - self.likelihood_float)}))',
             posterior.name
         )
         output = posterior.output()
@@ -94,11 +101,13 @@ class TestBinaryBayesRule(TestCase):
             prior=self.prior_beta,
             likelihood=self.likelihood_float_map
         ).posterior()
+        prior_name = str(self.prior_beta)
         for key, likelihood in self.likelihood_float_map.items():
+            likelihood_name = str(likelihood)
             self.assertEqual(
-                f'({str(self.prior_beta)} * {str(likelihood)}) / '
-                f'(({str(self.prior_beta)} * {str(likelihood)}) + '
-                f'((1 - {self.prior_beta}) * {str(1 - likelihood)}))',
+                f'({prior_name} * {likelihood_name}) / '
+                f'(({prior_name} * {likelihood_name}) + '
+                f'((1 - {prior_name}) * {str(1 - likelihood)}))',
                 posterior[key].name
             )
 
@@ -108,10 +117,12 @@ class TestBinaryBayesRule(TestCase):
             prior=self.prior_beta,
             likelihood=self.likelihood_beta
         ).posterior()
+        prior_name = str(self.prior_beta)
+        likelihood_name = str(self.likelihood_beta)
         self.assertEqual(
-            f'({str(self.prior_beta)} * {str(self.likelihood_beta)}) / '
-            f'(({str(self.prior_beta)} * {str(self.likelihood_beta)}) + '
-            f'((1 - {self.prior_beta}) * (1 - {str(self.likelihood_beta)})))',
+            f'({prior_name} * {likelihood_name}) / '
+            f'(({prior_name} * {likelihood_name}) + '
+            f'((1 - {prior_name}) * (1 - {likelihood_name})))',
             posterior.name
         )
         output = posterior.output()
@@ -124,11 +135,13 @@ class TestBinaryBayesRule(TestCase):
             prior=self.prior_beta,
             likelihood=self.likelihood_beta_map
         ).posterior()
+        prior_name = str(self.prior_beta)
         for key, likelihood in self.likelihood_beta_map.items():
+            likelihood_name = str(likelihood)
             self.assertEqual(
-                f'({str(self.prior_beta)} * {str(likelihood)}) / '
-                f'(({str(self.prior_beta)} * {str(likelihood)}) + '
-                f'((1 - {self.prior_beta}) * (1 - {str(likelihood)})))',
+                f'({prior_name} * {likelihood_name}) / '
+                f'(({prior_name} * {likelihood_name}) + '
+                f'((1 - {prior_name}) * (1 - {likelihood_name})))',
                 posterior[key].name
             )
 
@@ -142,13 +155,8 @@ class TestBinaryBayesRule(TestCase):
             (self.prior_float_map * self.likelihood_float) +
             ((1 - self.prior_float_map) * (1 - self.likelihood_float))
         )
-        for key in self.prior_float_map.keys():
-            self.assertEqual(
-                self.prior_float_map[key] *
-                self.likelihood_float /
-                normalization[key],
-                posterior[key]
-            )
+        expected = self.prior_float_map * self.likelihood_float / normalization
+        self.assertTrue(expected.equals(posterior))
 
     def test_posterior__p_fm__l_fm(self):
 
@@ -156,14 +164,13 @@ class TestBinaryBayesRule(TestCase):
             prior=self.prior_float_map,
             likelihood=self.likelihood_float_map
         ).posterior()
-        for key in self.prior_float_map.keys():
-            prior = self.prior_float_map[key]
-            likelihood = self.likelihood_float_map[key]
-            self.assertEqual(
-                (prior * likelihood) /
-                ((prior * likelihood) + ((1 - prior) * (1 - likelihood))),
-                posterior[key]
-            )
+        prior = self.prior_float_map
+        likelihood = self.likelihood_float_map
+        expected = (
+            (prior * likelihood) /
+            ((prior * likelihood) + ((1 - prior) * (1 - likelihood)))
+        )
+        self.assertTrue(expected.equals(posterior))
 
     def test_posterior__p_fm__l_b(self):
 
@@ -173,11 +180,13 @@ class TestBinaryBayesRule(TestCase):
             prior=prior,
             likelihood=likelihood
         ).posterior()
+        likelihood_name = str(likelihood)
         for key in self.prior_float_map.keys():
+            prior_name = str(prior[key])
             self.assertEqual(
-                f'({prior[key]} * {str(likelihood)}) / '
-                f'(({prior[key]} * {str(likelihood)}) + '
-                f'({1 - prior[key]} * (1 - {str(likelihood)})))',
+                f'({prior_name} * {likelihood_name}) / '
+                f'(({prior_name} * {likelihood_name}) + '
+                f'({1 - prior[key]} * (1 - {likelihood_name})))',
                 posterior[key].name
             )
 
@@ -190,10 +199,12 @@ class TestBinaryBayesRule(TestCase):
             likelihood=likelihood
         ).posterior()
         for key in self.prior_float_map.keys():
+            prior_name = str(prior[key])
+            likelihood_name = str(likelihood[key])
             self.assertEqual(
-                f'({prior[key]} * {str(likelihood[key])}) / '
-                f'(({prior[key]} * {str(likelihood[key])}) + '
-                f'({1 - prior[key]} * (1 - {str(likelihood[key])})))',
+                f'({prior_name} * {likelihood_name}) / '
+                f'(({prior_name} * {likelihood_name}) + '
+                f'({1 - prior[key]} * (1 - {likelihood_name})))',
                 posterior[key].name
             )
 
@@ -205,10 +216,12 @@ class TestBinaryBayesRule(TestCase):
             prior=prior,
             likelihood=likelihood
         ).posterior()
+        likelihood_name = str(likelihood)
         for key in self.prior_float_map.keys():
+            prior_name = str(prior[key])
             self.assertEqual(
-                f'({prior[key]} * {str(likelihood)}) / '
-                f'(({prior[key]} * {str(likelihood)}) + '
+                f'({prior_name} * {likelihood_name}) / '
+                f'(({prior_name} * {likelihood_name}) + '
                 f'(({str(1 - prior[key])}) * {str(1 - likelihood)}))',
                 posterior[key].name
             )
@@ -222,10 +235,12 @@ class TestBinaryBayesRule(TestCase):
             likelihood=likelihood
         ).posterior()
         for key in self.prior_float_map.keys():
+            prior_name = str(prior[key])
+            likelihood_name = str(likelihood[key])
             self.assertEqual(
-                f'({prior[key]} * {str(likelihood[key])}) / '
-                f'(({prior[key]} * {str(likelihood[key])}) + '
-                f'({1 - prior[key]} * (1 - {str(likelihood[key])})))',
+                f'({prior_name} * {likelihood_name}) / '
+                f'(({prior_name} * {likelihood_name}) + '
+                f'({1 - prior[key]} * (1 - {likelihood_name})))',
                 posterior[key].name
             )
 
@@ -237,11 +252,13 @@ class TestBinaryBayesRule(TestCase):
             prior=prior,
             likelihood=likelihood
         ).posterior()
+        likelihood_name = str(likelihood)
         for key in self.prior_beta_map.keys():
+            prior_name = str(prior[key])
             self.assertEqual(
-                f'({prior[key]} * {str(likelihood)}) / '
-                f'(({prior[key]} * {str(likelihood)}) + '
-                f'(({str(1 - prior[key])}) * (1 - {str(likelihood)})))',
+                f'({prior_name} * {likelihood_name}) / '
+                f'(({prior_name} * {likelihood_name}) + '
+                f'(({str(1 - prior[key])}) * (1 - {likelihood_name})))',
                 posterior[key].name
             )
 
@@ -254,9 +271,11 @@ class TestBinaryBayesRule(TestCase):
             likelihood=likelihood
         ).posterior()
         for key in self.prior_beta_map.keys():
+            prior_name = str(prior[key])
+            likelihood_name = str(likelihood[key])
             self.assertEqual(
-                f'({prior[key]} * {str(likelihood[key])}) / '
-                f'(({prior[key]} * {str(likelihood[key])}) + '
-                f'(({str(1 - prior[key])}) * (1 - {str(likelihood[key])})))',
+                f'({prior_name} * {likelihood_name}) / '
+                f'(({prior_name} * {likelihood_name}) + '
+                f'(({str(1 - prior[key])}) * (1 - {likelihood_name})))',
                 posterior[key].name
             )
@@ -9,16 +9,17 @@ from probability.distributions import Dirichlet
 
 class TestMultipleBayesRule(TestCase):
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
 
-        self.prior_dirichlet = Dirichlet([1 + 70, 1 + 25, 1 + 5])
-        self.likelihood_dirichlet = Dirichlet([1 + 6, 1 + 3, 1 + 1])
-        self.likelihood_dirichlet_map = Series({
+        cls.prior_dirichlet = Dirichlet([1 + 70, 1 + 25, 1 + 5])
+        cls.likelihood_dirichlet = Dirichlet([1 + 6, 1 + 3, 1 + 1])
+        cls.likelihood_dirichlet_map = Series({
             '$100': Dirichlet([1 + 8, 1 + 1, 1 + 1]),
             '$200': Dirichlet([1 + 6, 1 + 3, 1 + 1])
         })
-        self.prior_float_map = Series({'$100': 0.3, '$200': 0.2, '$300': 0.5})
-        self.likelihood_float_map = Series({
+        cls.prior_float_map = Series({'$100': 0.3, '$200': 0.2, '$300': 0.5})
+        cls.likelihood_float_map = Series({
             '$100': 0.1, '$200': 0.2, '$300': 0.3
         })
 
@@ -28,10 +29,12 @@ class TestMultipleBayesRule(TestCase):
             prior=self.prior_dirichlet,
             likelihood=self.likelihood_dirichlet
         ).posterior()
+        prior_name = str(self.prior_dirichlet)
+        likelihood_name = str(self.likelihood_dirichlet)
         self.assertEqual(
-            f'({str(self.prior_dirichlet)} * {str(self.likelihood_dirichlet)})'
+            f'({prior_name} * {likelihood_name})'
             f' / (sum'
-            f'({str(self.prior_dirichlet)} * {str(self.likelihood_dirichlet)})'
+            f'({prior_name} * {likelihood_name})'
             f')',
             posterior.name
         )
@@ -42,11 +45,13 @@ class TestMultipleBayesRule(TestCase):
             prior=self.prior_dirichlet,
             likelihood=self.likelihood_dirichlet_map
         ).posterior()
+        prior_name = str(self.prior_dirichlet)
         for key, likelihood in self.likelihood_dirichlet_map.items():
+            likelihood_name = str(likelihood)
             self.assertEqual(
-                f'({str(self.prior_dirichlet)} * {str(likelihood)})'
+                f'({prior_name} * {likelihood_name})'
                 f' / (sum'
-                f'({str(self.prior_dirichlet)} * {str(likelihood)})'
+                f'({prior_name} * {likelihood_name})'
                 f')',
                 posterior[key].name
             )
@@ -59,10 +64,7 @@ class TestMultipleBayesRule(TestCase):
         ).posterior()
         normalization = (self.prior_float_map *
                          self.likelihood_float_map).sum()
-        for key in self.prior_float_map.keys():
-            self.assertEqual(
-                self.prior_float_map[key] *
-                self.likelihood_float_map[key] /
-                normalization,
-                posterior[key]
-            )
+        expected = (
+            self.prior_float_map * self.likelihood_float_map / normalization
+        )
+        self.assertTrue(expected.equals(posterior))
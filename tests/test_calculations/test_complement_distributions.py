@@ -1,4 +1,3 @@
-from probability.distributions.mixins.rv_mixins import NUM_SAMPLES_COMPARISON
 from tests.test_calculations.base_test import BaseTest
 
 
@@ -12,7 +11,7 @@ class TestComplementDistributions(BaseTest):
     def test_comp__rvs1d__result(self):
 
         result = (1 - self.b1).output()
-        expected = 1 - (self.b1.rvs(NUM_SAMPLES_COMPARISON))
+        expected = 1 - self.b1_samples
         self.assertAlmostEqual(expected.mean(), result.mean(), 3)
         self.assertAlmostEqual(expected.std(), result.std(), 2)
         self.assertEqual(f'1 - {str(self.b1)}', result.name)
@@ -26,7 +25,7 @@ class TestComplementDistributions(BaseTest):
 
         result = (1 - self.d1).output()
         expected = (
-                1 - self.d1.rvs(NUM_SAMPLES_COMPARISON, full_name=True)
+                1 - self.d1_samples
         ).rename(columns=lambda c: f'1 - {c}')
         for column in expected.columns:
             self.assertAlmostEqual(expected[column].mean(),
@@ -1,5 +1,4 @@
 from probability.calculations.utils import sync_context
-from probability.distributions.mixins.rv_mixins import NUM_SAMPLES_COMPARISON
 from tests.test_calculations.base_test import BaseTest
 
 
@@ -33,8 +32,8 @@ class TestCompoundCalculations(BaseTest):
 
         result = sum([self.b1 * self.b2, (1 - self.b1) * (1 - self.b2)])
         sync_context(result)
-        b1s = self.b1.rvs(NUM_SAMPLES_COMPARISON)
-        b2s = self.b2.rvs(NUM_SAMPLES_COMPARISON)
+        b1s = self.b1_samples
+        b2s = self.b2_samples
         b1comps = 1 - b1s
         b2comps = 1 - b2s
         expected = (b1s * b2s) + (b1comps * b2comps)
@@ -53,7 +52,7 @@ class TestCompoundCalculations(BaseTest):
     def test_float__mul__comp_result(self):
 
         actual = 0.5 * (1 - self.b1).output()
-        expected = 0.5 * (1 - self.b1.rvs(NUM_SAMPLES_COMPARISON))
+        expected = 0.5 * (1 - self.b1_samples)
         self.assertAlmostEqual(expected.mean(), actual.mean(), 3)
         self.assertAlmostEqual(expected.std(), actual.std(), 3)
 
@@ -1,6 +1,5 @@
 from pandas import DataFrame
 
-from probability.distributions.mixins.rv_mixins import NUM_SAMPLES_COMPARISON
 from tests.test_calculations.base_test import BaseTest
 
 
@@ -16,7 +15,7 @@ class TestDivideDistributions(BaseTest):
     def test_float__div__rvs1d_result(self):
 
         actual = (1 / self.b1).output()
-        expected = 1 / self.b1.rvs(NUM_SAMPLES_COMPARISON)
+        expected = 1 / self.b1_samples
         self.assertAlmostEqual(expected.mean(), actual.mean(), 3)
         self.assertAlmostEqual(expected.std(), actual.std(), 3)
 
@@ -31,7 +30,7 @@ class TestDivideDistributions(BaseTest):
 
         actual = (1 / self.d1).output()
         expected = (
-            1 / self.d1.rvs(NUM_SAMPLES_COMPARISON, full_name=True)
+            1 / self.d1_samples
         ).rename(columns=lambda c: f'1 / {c}')
         for column in actual.columns:
             self.assertAlmostEqual(expected[column].mean(),
@@ -49,7 +48,7 @@ class TestDivideDistributions(BaseTest):
     def test_rvs1d__div__float_result(self):
 
         actual = (self.b1 / 2).output()
-        expected = self.b1.rvs(NUM_SAMPLES_COMPARISON) / 2
+        expected = self.b1_samples / 2
         self.assertAlmostEqual(expected.mean(), actual.mean(), 3)
         self.assertAlmostEqual(expected.std(), actual.std(), 3)
 
@@ -64,7 +63,7 @@ class TestDivideDistributions(BaseTest):
 
         actual = (self.d1 / 2).output()
         expected = (
-            self.d1.rvs(NUM_SAMPLES_COMPARISON, full_name=True) / 2
+            self.d1_samples / 2
         ).rename(columns=lambda c: f'{c} / 2')
         for column in actual.columns:
             self.assertAlmostEqual(expected[column].mean(),
@@ -83,8 +82,7 @@ class TestDivideDistributions(BaseTest):
 
         actual = (self.b1 / self.b2).output()
         expected = (
-            self.b1.rvs(NUM_SAMPLES_COMPARISON) /
-            self.b2.rvs(NUM_SAMPLES_COMPARISON)
+            self.b1_samples / self.b2_samples
         )
         self.assertAlmostEqual(expected.mean(), actual.mean(), 3)
         self.assertAlmostEqual(expected.std(), actual.std(), 3)
@@ -99,21 +97,20 @@ class TestDivideDistributions(BaseTest):
     def test_rvs2d__div__rvs2d_result(self):
 
         actual = (self.d1 / self.d2).output()
-        d1_samples = self.d1.rvs(NUM_SAMPLES_COMPARISON, full_name=True)
-        d2_samples = self.d2.rvs(NUM_SAMPLES_COMPARISON, full_name=True)
         expected = DataFrame.from_dict({
             f'{col_1} / {col_2}':
-                d1_samples[col_1] / d2_samples[col_2]
-            for col_1, col_2 in zip(d1_samples.columns, d2_samples.columns)
+                self.d1_samples[col_1] / self.d2_samples[col_2]
+            for col_1, col_2 in zip(self.d1_samples.columns,
+                                    self.d2_samples.columns)
         })
+        expected_means, actual_means = expected.mean(), actual.mean()
+        expected_stds, actual_stds = expected.std(), actual.std()
         for column in expected.columns:
             self.assertAlmostEqual(
-                expected.mean()[column],
-                actual.mean()[column], 2
+                expected_means[column], actual_means[column], 2
             )
             self.assertAlmostEqual(
-                expected.std()[column],
-                actual.std()[column], 2
+                expected_stds[column], actual_stds[column], 2
             )
 
     def test_rvs1d__div__rvs2d_name(self):
@@ -127,8 +124,8 @@ class TestDivideDistributions(BaseTest):
 
         actual = (self.b1 / self.d1).output()
         expected = (
-            self.d1.rvs(100_000, full_name=True).div(
-                self.b1.rvs(100_000), axis=0
+            self.d1_samples.div(
+                self.b1_samples, axis=0
             )
         ).rename(
             columns=lambda c: f'{str(self.b1)} / {c}'
@@ -155,8 +152,8 @@ class TestDivideDistributions(BaseTest):
 
         actual = (self.d1 / self.b1).output()
         expected = (
-            self.d1.rvs(100_000, full_name=True).div(
-                self.b1.rvs(100_000), axis=0
+            self.d1_samples.div(
+                self.b1_samples, axis=0
             )
         ).rename(
             columns=lambda c: f'{c} / {str(self.b1)}'
@@ -2,7 +2,6 @@ from itertools import product
 
 from pandas import DataFrame, Series
 
-from probability.distributions.mixins.rv_mixins import NUM_SAMPLES_COMPARISON
 from tests.test_calculations.base_test import BaseTest
 
 
@@ -15,7 +14,7 @@ class TestMultiplyDistributions(BaseTest):
 
     def test_float__mul__rvs1d_result(self):
 
-        expected = 0.5 * self.b1.rvs(100_000)
+        expected = 0.5 * self.b1_samples
         actual = (0.5 * self.b1).output()
         self.assertAlmostEqual(expected.mean(), actual.mean(), 3)
         self.assertAlmostEqual(expected.std(), actual.std(), 3)
@@ -29,7 +28,7 @@ class TestMultiplyDistributions(BaseTest):
 
     def test_rvs1d__mul__float_result(self):
 
-        expected = self.b1.rvs(100_000) * 0.5
+        expected = self.b1_samples * 0.5
         actual = (self.b1 * 0.5).output()
         self.assertAlmostEqual(expected.mean(), actual.mean(), 3)
         self.assertAlmostEqual(expected.std(), actual.std(), 3)
@@ -43,7 +42,7 @@ class TestMultiplyDistributions(BaseTest):
 
     def test_float__mul__rvs2d_result(self):
 
-        expected = (0.5 * self.d1.rvs(100_000, full_name=True)).rename(
+        expected = (0.5 * self.d1_samples).rename(
             columns=lambda c: f'0.5 * {c}'
         )
         actual = (0.5 * self.d1).output()
@@ -65,7 +64,7 @@ class TestMultiplyDistributions(BaseTest):
 
     def test_rvs2d__mul__float_result(self):
 
-        expected = (self.d1.rvs(100_000, full_name=True) * 0.5).rename(
+        expected = (self.d1_samples * 0.5).rename(
             columns=lambda c: f'{c} * 0.5'
         )
         actual = (self.d1 * 0.5).output()
@@ -102,7 +101,7 @@ class TestMultiplyDistributions(BaseTest):
 
     def test_float__mul__rvs1d__mul__rvs1d_result(self):
 
-        expected = 0.5 * self.b1.rvs(100_000) * self.b2.rvs(100_000)
+        expected = 0.5 * self.b1_samples * self.b2_samples
         actual = (0.5 * self.b1 * self.b2).output()
         self.assertAlmostEqual(expected.mean(), actual.mean(), 3)
         self.assertAlmostEqual(expected.std(), actual.std(), 3)
@@ -118,7 +117,7 @@ class TestMultiplyDistributions(BaseTest):
 
     def test_rvs1d__mul__float__mul__rvs1d_result(self):
 
-        expected = self.b1.rvs(100_000) * 0.5 * self.b2.rvs(100_000)
+        expected = self.b1_samples * 0.5 * self.b2_samples
         actual = (self.b1 * 0.5 * self.b2).output()
         self.assertAlmostEqual(expected.mean(), actual.mean(), 3)
         self.assertAlmostEqual(expected.std(), actual.std(), 3)
@@ -134,7 +133,7 @@ class TestMultiplyDistributions(BaseTest):
 
     def test_rvs1d__mul__rvs1d__mul__float_result(self):
 
-        expected = self.b1.rvs(100_000) * self.b2.rvs(100_000) * 0.5
+        expected = self.b1_samples * self.b2_samples * 0.5
         actual = (self.b1 * self.b2 * 0.5).output()
         self.assertAlmostEqual(expected.mean(), actual.mean(), 3)
         self.assertAlmostEqual(expected.std(), actual.std(), 3)
@@ -169,8 +168,8 @@ class TestMultiplyDistributions(BaseTest):
 
         actual = (self.b1 * self.d1).output()
         expected = (
-            self.d1.rvs(100_000, full_name=True).mul(
-                self.b1.rvs(100_000), axis=0
+            self.d1_samples.mul(
+                self.b1_samples, axis=0
             )
         ).rename(
             columns=lambda c: f'{str(self.b1)} * {c}'
@@ -197,8 +196,8 @@ class TestMultiplyDistributions(BaseTest):
 
         actual = (self.d1 * self.b1).output()
         expected = (
-            self.d1.rvs(100_000, full_name=True).mul(
-                self.b1.rvs(100_000), axis=0
+            self.d1_samples.mul(
+                self.b1_samples, axis=0
             )
         ).rename(
             columns=lambda c: f'{c} * {str(self.b1)}'
@@ -224,21 +223,20 @@ class TestMultiplyDistributions(BaseTest):
     def test_rvs2d__mul__rvs2d_result(self):
 
         actual = (self.d1 * self.d2).output()
-        d1_samples = self.d1.rvs(NUM_SAMPLES_COMPARISON, full_name=True)
-        d2_samples = self.d2.rvs(NUM_SAMPLES_COMPARISON, full_name=True)
         expected = DataFrame.from_dict({
             f'{col_1} * {col_2}':
-                d1_samples[col_1] * d2_samples[col_2]
-            for col_1, col_2 in zip(d1_samples.columns, d2_samples.columns)
+                self.d1_samples[col_1] * self.d2_samples[col_2]
+            for col_1, col_2 in zip(self.d1_samples.columns,
+                                    self.d2_samples.columns)
         })
+        expected_means, actual_means = expected.mean(), actual.mean()
+        expected_stds, actual_stds = expected.std(), actual.std()
         for column in expected.columns:
             self.assertAlmostEqual(
-                expected.mean()[column],
-                actual.mean()[column], 3
+                expected_means[column], actual_means[column], 3
             )
             self.assertAlmostEqual(
-                expected.std()[column],
-                actual.std()[column], 3
+                expected_stds[column], actual_stds[column], 3
             )
 
     def test_rvs1d__mul__series_names(self):
@@ -4,6 +4,7 @@ from pandas import Series, DataFrame
 
 from probability.discrete import Conditional
 from probability.discrete.discrete import Discrete
+from probability.discrete.prob_utils import valid_name_comparator
 
 
 class TestDiscrete(TestCase):
@@ -43,6 +44,68 @@ class TestDiscrete(TestCase):
             5
         )
 
+    def test_p__all_variables(self):
+        self.assertAlmostEqual(
+            189 / self.education__total,
+            self.education.p(gender='Female',
+                             highest_education='High school'),
+            5
+        )
+        self.assertEqual(
+            0, self.education.p(gender='Female', highest_education='None')
+        )
+        self.assertAlmostEqual(
+            0.25, self.coin_dist.p(coin_1='H', coin_2='T', x=1, y=0), 5
+        )
+
+    def test_p__exact_and_comparator_agree(self):
+
+        data = self.education.data
+        data.iloc[:] = 0.5
+        for gender, education in data.index:
+            self.assertEqual(
+                self.education.p(gender=gender,
+                                 highest_education=education),
+                self.education.p(gender__eq=gender,
+                                 highest_education__eq=education)
+            )
+
+    def test_p_batch(self):
+        states = DataFrame({
+            'highest_education': ['High school', 'College', 'None'],
+            'gender': ['Female', 'Male', 'Male']
+        })
+        expected = [189 / self.education__total,
+                    595 / self.education__total,
+                    0]
+        for expected_p, actual_p in zip(expected,
+                                        self.education.p_batch(states)):
+            self.assertAlmostEqual(expected_p, actual_p, 5)
+
+    def test_p_batch__overflowing_keys(self):
+        # 600 ** 7 combinations of states don't fit in an int64 key
+        variables = [f'v{v}' for v in range(7)]
+        steps = [1, 7, 11, 13, 17, 19, 23]
+        big = Discrete.from_probs(
+            data={
+                tuple((i * step) % 600 for step in steps): 1 / 600
+                for i in range(600)
+            },
+            variables=variables
+        )
+        states = DataFrame({
+            variable: [(5 * step) % 600, (5 * step) % 600 + (v == 6)]
+            for v, (variable, step) in enumerate(zip(variables, steps))
+        })
+        actual = big.p_batch(states)
+        self.assertAlmostEqual(1 / 600, actual[0], 10)
+        self.assertEqual(0, actual[1])
+
+    def test_p_batch__empty(self):
+        empty = Discrete.from_probs(data={}, variables=['A'])
+        actual = empty.p_batch(DataFrame({'A': [1, 2]}))
+        self.assertListEqual([0.0, 0.0], list(actual))
+
     def test_p_or(self):
         total__high_school__or__female = 231 + 136 + 189 + 763 + 172
         self.assertAlmostEqual(
@@ -312,6 +375,114 @@ class TestDiscrete(TestCase):
         actual = xor.given(A=0).data
         self.assertTrue(expected.equals(actual))
 
+    def test_conditional(self):
+
+        education__given__gender = self.education.conditional('gender')
+        self.assertIsInstance(education__given__gender, Conditional)
+        self.assertEqual(['highest_education'],
+                         education__given__gender.joint_variables)
+        self.assertEqual(['gender'],
+                         education__given__gender.conditional_variables)
+        total__female = 136 + 189 + 763 + 172
+        self.assertAlmostEqual(
+            189 / total__female,
+            education__given__gender.data.loc['High school', 'Female'],
+            5
+        )
+        for total in education__given__gender.data.sum():
+            self.assertAlmostEqual(1, total, 5)
+
+    def test_conditional__zero_mass_group(self):
+
+        a_b = Discrete.from_probs(
+            data={(0, 0): 0, (1, 0): 0, (0, 1): 0.5, (1, 1): 0.5},
+            variables=['A', 'B']
+        )
+        a__given__b = a_b.conditional('B')
+        self.assertTrue(a__given__b.data[0].isnull().all())
+        self.assertAlmostEqual(0.5, a__given__b.data.loc[0, 1], 5)
+        self.assertAlmostEqual(0.5, a__given__b.data.loc[1, 1], 5)
+
+    def test_marginal_is_reused(self):
+
+        gender = self.education.marginal('gender')
+        self.assertIs(gender, self.education.marginal('gender'))
+        self.assertIsNot(
+            gender, self.education.marginal('gender', 'highest_education')
+        )
+        self.assertAlmostEqual(
+            (112 + 231 + 595 + 242) / self.education__total,
+            gender.p(gender='Male'),
+            5
+        )
+
+    def test_data_changes_do_not_affect_distribution(self):
+
+        p_male = self.education.p(gender='Male',
+                                  highest_education='College')
+        data = self.education.data
+        data.iloc[:] = 0.5
+        marginal = self.education.marginal('gender').data
+        marginal.iloc[:] = 0.5
+        conditional = self.education.conditional('gender').data
+        conditional.iloc[:, :] = 0.5
+        self.assertEqual(p_male, self.education.p(
+            gender='Male', highest_education='College'
+        ))
+        self.assertAlmostEqual(
+            (112 + 231 + 595 + 242) / self.education__total,
+            self.education.marginal('gender').p(gender='Male'),
+            5
+        )
+        self.assertAlmostEqual(
+            595 / (112 + 231 + 595 + 242),
+            self.education.conditional('gender').data.loc['College', 'Male'],
+            5
+        )
+
+    def test_data_from_frame_is_copied(self):
+
+        frame = DataFrame({'A': [0, 1], 'p': [0.25, 0.75]}).set_index('A')
+        a = Discrete(data=frame['p'], variables='A', states=[0, 1])
+        frame.loc[0, 'p'] = 0.5
+        self.assertEqual(0.5, frame.loc[0, 'p'])
+        self.assertEqual(0.25, a.p(A=0))
+
+    def test_marginal__reordered_variables(self):
+
+        education__gender = self.education.marginal(
+            'highest_education', 'gender'
+        )
+        self.assertAlmostEqual(
+            189 / self.education__total,
+            education__gender.p(gender='Female',
+                                highest_education='High school'),
+            5
+        )
+        self.assertAlmostEqual(
+            self.total__high_school / self.education__total,
+            education__gender.marginal('highest_education').p(
+                highest_education='High school'
+            ),
+            5
+        )
+
+    def test_multiply_conditional__multiple_variables(self):
+
+        coins = Discrete.from_probs(
+            data={
+                ('H', 'H'): 0.25, ('H', 'T'): 0.25,
+                ('T', 'H'): 0.25, ('T', 'T'): 0.25
+            },
+            variables=['coin_2', 'coin_1']
+        )
+        x__coins_y = self.coin_dist.conditional('coin_1', 'coin_2', 'y')
+        coins_x__y = coins * x__coins_y
+        self.assertEqual(['coin_1', 'coin_2', 'x'], coins_x__y.joint_variables)
+        self.assertEqual(['y'], coins_x__y.conditional_variables)
+        self.assertAlmostEqual(0.25, coins_x__y.data.loc[('H', 'H', 1), 1])
+        self.assertAlmostEqual(0.25, coins_x__y.data.loc[('T', 'T', 0), 1])
+
     def test_mode_1d_categorical(self):
 
         counts = Series({
@@ -428,3 +599,12 @@ class TestDiscrete(TestCase):
             variables='x'
         )
         self.assertRaises(TypeError, discrete.max)
+
+    def test_valid_name_comparator(self):
+
+        for var_names in (['A', 'B'], ('B', 'A'), {'A', 'B'},
+                          frozenset(['A', 'B'])):
+            self.assertTrue(valid_name_comparator('A', var_names))
+            self.assertTrue(valid_name_comparator('B__not_in', var_names))
+            self.assertFalse(valid_name_comparator('C', var_names))
+            self.assertFalse(valid_name_comparator('A__xx', var_names))
@@ -58,3 +58,24 @@ class TestDecisionTree(TestCase):
         for exp, act in zip(expected, unique_expected_costs):
             self.assertAlmostEqual(exp, act)
         self.assertEqual(len(costs), 28)
+
+    def test_node_lookup(self):
+
+        dt = self.actions_group.make_tree(max_depth=2)
+        self.assertEqual('D1', dt.node('D1').name)
+        self.assertEqual(1, dt.decision_node('D1').depth)
+        with self.assertRaises(ValueError):
+            dt.node('X-IVF')  # one per decision node
+        self.assertEqual(1, dt.node('X-IVF', depth=1).depth)
+        self.assertEqual(2, dt.chance_node('X-IVF', depth=2).depth)
+        with self.assertRaises(ValueError):
+            dt.add_decision('D1')
+
+    def test_solve_is_repeatable(self):
+
+        dt = self.actions_group.make_tree(max_depth=3)
+        dt.solve()
+        amounts_1 = dt.amounts()
+        dt.solve()
+        amounts_2 = dt.amounts()
+        self.assertTrue(amounts_1.equals(amounts_2))
@@ -0,0 +1,50 @@
+from unittest.case import TestCase
+
+from probability.distributions import PERT
+from probability.models.project_network import ProjectNetwork, ProjectTask
+
+
+class TestProjectNetwork(TestCase):
+
+    def setUp(self) -> None:
+
+        self.network = ProjectNetwork()
+        self.network.add_task(ProjectTask('A', PERT(1, 4, 7)))
+        self.network.add_task(ProjectTask('B1', PERT(2, 5, 8)), parents='A')
+        self.network.add_task(ProjectTask('B2', PERT(3, 6, 9)), parents='A')
+        self.network.add_task(ProjectTask('C', PERT(6, 21, 30)),
+                              parents='B1')
+        self.network.add_task(ProjectTask('D', PERT(5, 14, 17)),
+                              parents=['B1', 'B2'])
+        self.network.add_task(ProjectTask('E', PERT(3, 12, 21)),
+                              parents=['C', 'D'], end=True)
+        self.network.add_percentiles()
+
+    def test_path_lengths(self):
+
+        lengths = self.network.path_lengths()
+        self.assertEqual(3, len(lengths))
+        self.assertEqual(
+            {('START', 'A', 'B1', 'C', 'E', 'END'),
+             ('START', 'A', 'B1', 'D', 'E', 'END'),
+             ('START', 'A', 'B2', 'D', 'E', 'END')},
+            set(lengths['path'])
+        )
+
+    def test_critical_path_length(self):
+
+        self.assertAlmostEqual(
+            self.network.path_lengths()['length'].max(),
+            self.network.critical_path_length()
+        )
+
+    def test_critical_path_length__dead_end_task(self):
+
+        self.network.add_task(ProjectTask('X', PERT(50, 60, 70)),
+                              parents='A')
+        self.network.add_task(ProjectTask('Y', PERT(1, 2, 3)), parents='X')
+        self.network.add_percentiles()
+        self.assertAlmostEqual(
+            self.network.path_lengths()['length'].max(),
+            self.network.critical_path_length()
+        )
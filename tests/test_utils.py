@@ -2,7 +2,8 @@ from unittest.case import TestCase
 
 from pandas import Series
 
-from probability.utils import series_is_binary
+from probability.utils import series_is_binary, k_tuples_summing_to_n, \
+    num_format
 
 
 class TestUtils(TestCase):
@@ -38,3 +39,18 @@ class TestUtils(TestCase):
         self.assertTrue(series_is_binary(self.int_binary_ones))
         self.assertTrue(series_is_binary(self.float_binary_ones))
         self.assertTrue(series_is_binary(self.bool_binary_ones))
+
+    def test_k_tuples_summing_to_n(self):
+
+        expected = [
+            (0, 0, 2), (0, 1, 1), (0, 2, 0),
+            (1, 0, 1), (1, 1, 0), (2, 0, 0)
+        ]
+        self.assertEqual(expected, list(k_tuples_summing_to_n(k=3, n=2)))
+
+    def test_num_format(self):
+
+        self.assertEqual('10', num_format(10, 3))
+        self.assertEqual('0.25', num_format(0.25, 3))
+        self.assertEqual('0.333', num_format(1 / 3, 3))
+        self.assertEqual('0.3', num_format(0.1 + 0.2, 3))